@@ -6,22 +6,22 @@ A Python application that processes receipt images from Google Drive or Google P
 extracts purchase data using OCR, and exports to structured spreadsheet format.
 """
 
+import re
 import sys
 import logging
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from src.utils.config import ConfigManager
 from src.utils.logging import setup_logging
-from src.auth.google_auth import GoogleAuthManager
-from src.auth.credentials import CredentialsManager
 
 
+@lru_cache(maxsize=1)
 def setup_argument_parser() -> argparse.ArgumentParser:
-    """Set up command line argument parser."""
+    """Set up command line argument parser (built once per process)."""
     parser = argparse.ArgumentParser(
         description='Receipt Scanner - Process receipt images with OCR',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -136,6 +136,23 @@ Examples:
         action='store_true',
         help='Disable image preprocessing'
     )
+    process_group.add_argument(
+        '--ocr-workers',
+        type=int,
+        metavar='N',
+        help='Number of images to OCR concurrently (default: CPU count)'
+    )
+    process_group.add_argument(
+        '--tier1-threshold',
+        type=float,
+        metavar='THRESHOLD',
+        help='Try fast downscaled Tesseract first and accept results at or above this confidence'
+    )
+    process_group.add_argument(
+        '--no-ocr-cache',
+        action='store_true',
+        help='Re-run OCR even for images with cached results'
+    )
     process_group.add_argument(
         '--ocr-only',
         action='store_true',
@@ -168,6 +185,19 @@ Examples:
     )
     
     # Logging options
+    daemon_group = parser.add_argument_group('Daemon')
+    daemon_group.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Run as a background daemon that keeps credentials and connections warm'
+    )
+    daemon_group.add_argument(
+        '--socket',
+        type=str,
+        metavar='PATH',
+        help='Unix socket path for --daemon (default: $RECEIPT_SCANNER_SOCKET or /tmp/receipt-scanner.sock)'
+    )
+    
     log_group = parser.add_argument_group('Logging')
     log_group.add_argument(
         '--log-level',
@@ -187,6 +217,7 @@ Examples:
 
 def handle_setup_command() -> None:
     """Display setup instructions."""
+    from src.auth.credentials import CredentialsManager
     creds_manager = CredentialsManager()
     
     print("=" * 60)
@@ -202,6 +233,9 @@ def handle_setup_command() -> None:
 
 def handle_auth_command(args) -> bool:
     """Handle authentication command."""
+    from src.auth.credentials import CredentialsManager
+    from src.auth.google_auth import GoogleAuthManager
+    
     try:
         # Check for credentials file
         creds_manager = CredentialsManager()
@@ -238,6 +272,8 @@ def handle_auth_command(args) -> bool:
 
 def handle_revoke_command() -> bool:
     """Handle credential revocation command."""
+    from src.auth.google_auth import GoogleAuthManager
+    
     try:
         auth_manager = GoogleAuthManager()
         if auth_manager.revoke_credentials():
@@ -252,10 +288,106 @@ def handle_revoke_command() -> bool:
         return False
 
 
-def main():
-    """Main application entry point."""
+def _safe_float(value) -> float:
+    """Convert a parsed amount to float, treating missing or invalid values as 0."""
+    try:
+        return float(value) if value else 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+
+_MERCHANT_KEY_STRIP = re.compile(r'[^a-z0-9 ]')
+
+
+def _merchant_key(name: str) -> str:
+    """Normalize a merchant name for deduplication."""
+    return ' '.join(_MERCHANT_KEY_STRIP.sub('', name.lower()).split())[:64]
+
+
+@lru_cache(maxsize=1)
+def _create_auth_manager():
+    """Create the process-wide auth manager."""
+    from src.auth.google_auth import GoogleAuthManager
+    return GoogleAuthManager()
+
+
+def _get_auth_manager():
+    """Get the process-wide auth manager with the saved token loaded."""
+    auth_manager = _create_auth_manager()
+    
+    # A daemon outlives the access token; reload (and refresh) it once it
+    # is no longer valid rather than failing every later command
+    if not auth_manager.is_authenticated():
+        auth_manager.load_saved_credentials()
+    return auth_manager
+
+
+# Path options that refer to the invoking shell's working directory
+_PATH_OPTIONS = ('config', 'output_dir', 'log_file')
+
+
+def _run_daemon_command(argv, cwd=None) -> int:
+    """Run one CLI command inside the daemon."""
+    if '--daemon' in argv:
+        print("ERROR: A daemon is already running.")
+        return 1
+    
+    # Credentials may have been revoked or renewed by a previous command
+    if '--auth' in argv or '--revoke' in argv:
+        _create_auth_manager.cache_clear()
+    
+    return main(argv, cwd=cwd)
+
+
+def client_main(argv=None) -> int:
+    """Forward a command to a running daemon, or run it locally if there is none."""
+    from src.utils.daemon import send_command, DEFAULT_SOCKET_PATH
+    argv = sys.argv[1:] if argv is None else argv
+    
+    # Only --socket matters here; the daemon parses the full command
+    socket_parser = argparse.ArgumentParser(add_help=False)
+    socket_parser.add_argument('--socket')
+    socket_args, _ = socket_parser.parse_known_args(argv)
+    
+    response = send_command(argv, socket_args.socket or DEFAULT_SOCKET_PATH)
+    if response is None:
+        return main(argv)
+    
+    sys.stdout.write(response['output'])
+    return response['exit_code']
+
+
+def _write_lines(lines) -> None:
+    """Write buffered output lines to stdout in one call and clear the buffer."""
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+        lines.clear()
+
+
+def main(argv=None, cwd=None):
+    """
+    Main application entry point.
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+        cwd: Directory to resolve relative path options against, when the
+            command comes from a daemon client running elsewhere
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    
+    # Fast path: setup instructions need neither the parser nor configuration
+    if argv == ['--setup']:
+        handle_setup_command()
+        return 0
+    
     parser = setup_argument_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    
+    if cwd:
+        for option in _PATH_OPTIONS:
+            value = getattr(args, option)
+            if value:
+                setattr(args, option, str(Path(cwd, value)))
     
     # Handle setup command first
     if args.setup:
@@ -271,6 +403,14 @@ def main():
     logger = logging.getLogger(__name__)
     logger.info("Receipt Scanner starting...")
     
+    if args.daemon:
+        from src.utils.daemon import serve, DEFAULT_SOCKET_PATH
+        socket_path = args.socket or DEFAULT_SOCKET_PATH
+        if not serve(_run_daemon_command, socket_path):
+            print(f"ERROR: A daemon is already running on {socket_path}")
+            return 1
+        return 0
+    
     # Handle authentication commands
     if args.revoke:
         success = handle_revoke_command()
@@ -282,6 +422,7 @@ def main():
     
     # Load configuration
     try:
+        from src.utils.config import ConfigManager
         config_manager = ConfigManager(args.config)
         config = config_manager.load_config()
         
@@ -298,6 +439,12 @@ def main():
             config.google_photos_album_id = args.photos_album
         if args.no_preprocessing:
             config.processing.use_opencv_preprocessing = False
+        if args.no_ocr_cache:
+            config.processing.use_ocr_cache = False
+        if args.ocr_workers:
+            config.processing.ocr_workers = args.ocr_workers
+        if args.tier1_threshold is not None:
+            config.processing.tier1_threshold = args.tier1_threshold
         
         logger.info(f"Configuration loaded from: {config_manager.config_file or 'defaults'}")
         
@@ -359,7 +506,7 @@ def main():
         return 1
     
     # Check authentication
-    auth_manager = GoogleAuthManager()
+    auth_manager = _get_auth_manager()
     if not auth_manager.is_authenticated():
         print("ERROR: Not authenticated with Google services!")
         print("Run 'python main.py --auth' to authenticate first.")
@@ -398,64 +545,67 @@ def main():
                 results = processor.process_photos_album(config.google_photos_album_id)
         
         if results:
-            # Display results
-            print("\n" + "="*60)
-            print("PROCESSING RESULTS")
-            print("="*60)
-            print(f"Source: {results['source_name']} ({results['source_type']})")
-            print(f"Total files found: {results['total_files_found']}")
-            print(f"Successfully processed: {results['processed_files']}")
-            print(f"Skipped (cached): {results['skipped_files']}")
-            print(f"Errors: {results['error_files']}")
+            # Display results, buffered into a single write
+            report = []
+            report.append("\n" + "="*60)
+            report.append("PROCESSING RESULTS")
+            report.append("="*60)
+            report.append(f"Source: {results['source_name']} ({results['source_type']})")
+            report.append(f"Total files found: {results['total_files_found']}")
+            report.append(f"Successfully processed: {results['processed_files']}")
+            report.append(f"Skipped (cached): {results['skipped_files']}")
+            report.append(f"Errors: {results['error_files']}")
             
             if results['duplicate_groups'] > 0:
-                print(f"Duplicate groups found: {results['duplicate_groups']}")
+                report.append(f"Duplicate groups found: {results['duplicate_groups']}")
             
             # Display OCR results if available
             if 'ocr_results' in results:
-                print(f"OCR Success: {results['ocr_success_count']}/{len(results['ocr_results'])}")
-                print(f"Valid receipts: {results['receipts_extracted']}")
+                report.append(f"OCR Success: {results['ocr_success_count']}/{len(results['ocr_results'])}")
+                report.append(f"Valid receipts: {results['receipts_extracted']}")
+                
+                if 'ocr_upgrade_ratio' in results:
+                    report.append(f"Tier-1 (local) hits: {results['tier1_hits']}, upgraded to full OCR: {results['tier2_upgrades']} ({results['ocr_upgrade_ratio']:.1%} upgrade rate)")
                 
                 # Show summary of successful OCR results
                 successful_ocr = [r for r in results['ocr_results'] if r.get('success')]
                 if successful_ocr:
-                    print(f"\nOCR Methods used:")
+                    report.append(f"\nOCR Methods used:")
                     method_counts = {}
                     for r in successful_ocr:
                         method = r.get('ocr_method', 'unknown')
                         method_counts[method] = method_counts.get(method, 0) + 1
                     
                     for method, count in method_counts.items():
-                        print(f"  {method}: {count}")
+                        report.append(f"  {method}: {count}")
                     
                     # Show average confidence
                     avg_confidence = sum(r.get('ocr_confidence', 0) for r in successful_ocr) / len(successful_ocr)
-                    print(f"Average OCR confidence: {avg_confidence:.1%}")
+                    report.append(f"Average OCR confidence: {avg_confidence:.1%}")
                     
                     # Show receipts with valid data
                     valid_receipts = [r for r in successful_ocr if r.get('receipt_data') and 
                                     r['receipt_data'].get('confidence_score', 0) >= config.processing.confidence_threshold]
                     
                     if valid_receipts:
-                        print(f"\nValid Receipt Summary:")
-                        total_amount = 0
-                        merchants = set()
+                        report.append(f"\nValid Receipt Summary:")
+                        total_amount = sum(_safe_float(r['receipt_data'].get('total_amount')) for r in valid_receipts)
                         
-                        for receipt in valid_receipts:
-                            rd = receipt['receipt_data']
-                            if rd.get('total_amount'):
-                                try:
-                                    total_amount += float(rd['total_amount'])
-                                except (ValueError, TypeError):
-                                    pass
-                            if rd.get('merchant_name'):
-                                merchants.add(rd['merchant_name'])
+                        # Key on the normalized name so 'WALMART' and 'Walmart ' count once,
+                        # keeping the first spelling seen for display
+                        merchants = {}
+                        for r in valid_receipts:
+                            merchant_name = r['receipt_data'].get('merchant_name')
+                            if merchant_name:
+                                merchants.setdefault(_merchant_key(merchant_name), merchant_name.strip())
                         
-                        print(f"  Total amount processed: ${total_amount:.2f}")
-                        print(f"  Unique merchants: {len(merchants)}")
+                        report.append(f"  Total amount processed: ${total_amount:.2f}")
+                        report.append(f"  Unique merchants: {len(merchants)}")
                         
                         if len(merchants) <= 5:
-                            print(f"  Merchants: {', '.join(merchants)}")
+                            report.append(f"  Merchants: {', '.join(merchants.values())}")
+                        
+                        _write_lines(report)
                         
                         # Handle export if requested and we have valid receipts
                         if (args.export or args.export_templates or args.export_comprehensive) and valid_receipts:
@@ -542,19 +692,21 @@ def main():
             
             # Display cache stats
             cache_stats = processor.get_cache_stats()
-            print(f"\nCache Usage: {cache_stats['mb_used']} MB / {cache_stats['max_size_mb']} MB ({cache_stats['usage_percent']}%)")
-            print(f"Unique files: {cache_stats['unique_files']}, Duplicates: {cache_stats['duplicate_files']}")
+            report.append(f"\nCache Usage: {cache_stats['mb_used']} MB / {cache_stats['max_size_mb']} MB ({cache_stats['usage_percent']}%)")
+            report.append(f"Unique files: {cache_stats['unique_files']}, Duplicates: {cache_stats['duplicate_files']}")
             
             if args.ocr:
                 if args.export or args.export_templates or args.export_comprehensive:
-                    print("\n✓ Phase 4 OCR processing and export completed successfully!")
-                    print("All phases implemented: Image processing, OCR, data extraction, and export.")
+                    report.append("\n✓ Phase 4 OCR processing and export completed successfully!")
+                    report.append("All phases implemented: Image processing, OCR, data extraction, and export.")
                 else:
-                    print("\n✓ Phase 3 OCR processing completed successfully!")
-                    print("Next: Add --export, --export-templates, or --export-comprehensive for data export.")
+                    report.append("\n✓ Phase 3 OCR processing completed successfully!")
+                    report.append("Next: Add --export, --export-templates, or --export-comprehensive for data export.")
             else:
-                print("\n✓ Phase 2 processing completed successfully!")
-                print("Next: Add --ocr flag to enable OCR and data extraction.")
+                report.append("\n✓ Phase 2 processing completed successfully!")
+                report.append("Next: Add --ocr flag to enable OCR and data extraction.")
+            
+            _write_lines(report)
         
         logger.info("Receipt Scanner Phase 2 completed successfully")
         return 0
@@ -33,6 +33,7 @@ setup(
     entry_points={
         "console_scripts": [
             "receipt-scanner=main:main",
+            "receipt-scanner-client=main:client_main",
         ],
     },
     include_package_data=True,
@@ -1,13 +1,21 @@
 import os
-import json
+import orjson
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 
 class CredentialsManager:
     """Manages API credentials and configuration securely."""
     
+    # OAuth client and service account key files are a few KB; anything far
+    # larger is not a credentials file and isn't worth reading into memory
+    MAX_CREDENTIALS_FILE_SIZE = 64 * 1024
+    
+    OAUTH_REQUIRED_FIELDS = frozenset({'client_id', 'client_secret', 'auth_uri', 'token_uri'})
+    SERVICE_ACCOUNT_REQUIRED_FIELDS = frozenset({'client_email', 'private_key', 'project_id'})
+    
     def __init__(self, config_dir: str = 'config'):
         """
         Initialize credentials manager.
@@ -18,6 +26,28 @@ class CredentialsManager:
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(exist_ok=True)
         self.logger = logging.getLogger(__name__)
+        
+        # Standard search locations, after any environment variable override
+        user_config_dir = Path.home() / '.config' / 'receipt-scanner'
+        self._standard_cred_paths = (
+            self.config_dir / 'credentials.json',
+            Path('credentials.json'),
+            user_config_dir / 'credentials.json'
+        )
+        self._standard_sa_paths = (
+            self.config_dir / 'service-account.json',
+            Path('service-account.json'),
+            user_config_dir / 'service-account.json'
+        )
+        
+        # Resolved credential paths, keyed by file name (None = not found)
+        self._path_cache: Dict[str, Optional[Path]] = {}
+        
+        # Files in config_dir, from a single directory scan (None = not scanned)
+        self._config_dir_files: Optional[Dict[str, str]] = None
+        
+        # Validation results keyed by (path, mtime_ns, size)
+        self._validation_cache: Dict[Tuple[str, int, int], bool] = {}
     
     def get_google_credentials_path(self) -> Optional[Path]:
         """
@@ -26,23 +56,7 @@ class CredentialsManager:
         Returns:
             Path to credentials file if exists, None otherwise
         """
-        # Check environment variable first
-        creds_path = os.getenv('GOOGLE_CREDENTIALS_FILE')
-        if creds_path and Path(creds_path).exists():
-            return Path(creds_path)
-        
-        # Check standard locations
-        standard_paths = [
-            self.config_dir / 'credentials.json',
-            Path('credentials.json'),
-            Path.home() / '.config' / 'receipt-scanner' / 'credentials.json'
-        ]
-        
-        for path in standard_paths:
-            if path.exists():
-                return path
-        
-        return None
+        return self._find_credentials_file('GOOGLE_CREDENTIALS_FILE', 'credentials.json', self._standard_cred_paths)
     
     def get_service_account_path(self) -> Optional[Path]:
         """
@@ -51,23 +65,59 @@ class CredentialsManager:
         Returns:
             Path to service account key if exists, None otherwise
         """
-        # Check environment variable first
-        sa_path = os.getenv('GOOGLE_SERVICE_ACCOUNT_FILE')
-        if sa_path and Path(sa_path).exists():
-            return Path(sa_path)
+        return self._find_credentials_file('GOOGLE_SERVICE_ACCOUNT_FILE', 'service-account.json', self._standard_sa_paths)
+    
+    def invalidate_paths(self) -> None:
+        """Forget resolved credential paths, e.g. after keys are rotated or moved."""
+        self._path_cache.clear()
+        self._validation_cache.clear()
+        self._config_dir_files = None
+    
+    def _find_credentials_file(self, env_var: str, file_name: str,
+                               standard_paths: Tuple[Path, ...]) -> Optional[Path]:
+        """
+        Resolve a credentials file once and reuse the result on later calls.
         
-        # Check standard locations
-        standard_paths = [
-            self.config_dir / 'service-account.json',
-            Path('service-account.json'),
-            Path.home() / '.config' / 'receipt-scanner' / 'service-account.json'
-        ]
+        Args:
+            env_var: Environment variable that may point at the file
+            file_name: Credentials file name, used as the cache key
+            standard_paths: Locations to check when the variable is unset
+            
+        Returns:
+            Path to the file if it exists, None otherwise
+        """
+        if file_name in self._path_cache:
+            return self._path_cache[file_name]
         
-        for path in standard_paths:
-            if path.exists():
-                return path
+        # Check environment variable first, then standard locations
+        env_path = os.getenv(env_var)
+        candidate_paths = ((Path(env_path),) if env_path else ()) + standard_paths
         
-        return None
+        found = next((path for path in candidate_paths if self._path_exists(path)), None)
+        self._path_cache[file_name] = found
+        return found
+    
+    def _path_exists(self, path: Path) -> bool:
+        """Check a candidate path, answering from the config_dir scan when possible."""
+        if path.parent == self.config_dir:
+            return path.name in self._scan_config_dir()
+        return path.exists()
+    
+    def _scan_config_dir(self) -> Dict[str, str]:
+        """
+        List the files in config_dir with one scandir call and reuse the result.
+        
+        Returns:
+            Dict mapping file name to full path
+        """
+        if self._config_dir_files is None:
+            try:
+                with os.scandir(self.config_dir) as entries:
+                    self._config_dir_files = {entry.name: entry.path for entry in entries if entry.is_file()}
+            except OSError as e:
+                self.logger.warning(f"Failed to scan config directory {self.config_dir}: {str(e)}")
+                self._config_dir_files = {}
+        return self._config_dir_files
     
     def validate_credentials_file(self, file_path: Path) -> bool:
         """
@@ -80,29 +130,57 @@ class CredentialsManager:
             bool: True if valid, False otherwise
         """
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            # An unchanged file keeps its previous result
+            stat = os.stat(file_path)
+            cache_key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+            if cache_key in self._validation_cache:
+                return self._validation_cache[cache_key]
             
-            # Check for required OAuth 2.0 fields
-            if 'installed' in data or 'web' in data:
-                client_config = data.get('installed') or data.get('web')
-                required_fields = ['client_id', 'client_secret', 'auth_uri', 'token_uri']
-                
-                if all(field in client_config for field in required_fields):
-                    return True
+            if stat.st_size > self.MAX_CREDENTIALS_FILE_SIZE:
+                self.logger.error(f"Credentials file too large ({stat.st_size} bytes): {file_path}")
+                is_valid = False
+            else:
+                with open(file_path, 'rb') as f:
+                    is_valid = self._has_required_fields(orjson.loads(f.read(self.MAX_CREDENTIALS_FILE_SIZE)))
             
-            # Check for service account format
-            elif 'type' in data and data['type'] == 'service_account':
-                required_fields = ['client_email', 'private_key', 'project_id']
-                if all(field in data for field in required_fields):
-                    return True
-            
-            return False
+            self._validation_cache[cache_key] = is_valid
+            return is_valid
             
         except Exception as e:
             self.logger.error(f"Failed to validate credentials file: {str(e)}")
             return False
     
+    def validate_all(self, paths: List[Path]) -> Dict[Path, bool]:
+        """
+        Validate several credentials files, reading them in parallel.
+        
+        Args:
+            paths: Paths to credentials files
+            
+        Returns:
+            Dict mapping each path to its validation result
+        """
+        unique_paths = list(dict.fromkeys(paths))
+        if not unique_paths:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(unique_paths))) as executor:
+            results = executor.map(self.validate_credentials_file, unique_paths)
+            return dict(zip(unique_paths, results))
+    
+    def _has_required_fields(self, data: Dict[str, Any]) -> bool:
+        """Check parsed credentials for the fields OAuth or service account auth needs."""
+        # OAuth 2.0 client secrets nest their fields under 'installed' or 'web'
+        client_config = data.get('installed') or data.get('web')
+        if client_config is not None:
+            return isinstance(client_config, dict) and self.OAUTH_REQUIRED_FIELDS.issubset(client_config)
+        
+        # Service account key
+        if data.get('type') == 'service_account':
+            return self.SERVICE_ACCOUNT_REQUIRED_FIELDS.issubset(data)
+        
+        return False
+    
     def setup_instructions(self) -> str:
         """
         Get setup instructions for Google API credentials.
@@ -1,23 +1,48 @@
 import os
 import json
 import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, Future
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple, TYPE_CHECKING
 
-from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+
+# The OAuth flow, API client and transport modules pull in httplib2,
+# oauthlib and requests; they are imported where first needed so that
+# commands which never call an API start quickly.
+if TYPE_CHECKING:
+    from google.auth.transport.requests import AuthorizedSession, Request
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 
 class GoogleAuthManager:
     """Handles Google API authentication with OAuth 2.0 flow."""
     
-    SCOPES = [
+    SCOPES: Tuple[str, ...] = (
         'https://www.googleapis.com/auth/drive.readonly',
         'https://www.googleapis.com/auth/photoslibrary.readonly',
         'https://www.googleapis.com/auth/cloud-platform'
-    ]
+    )
+    
+    # Keep-alive connections held per host by the shared HTTP session
+    HTTP_POOL_SIZE = 20
+    
+    # Discovery documents for APIs the client library doesn't bundle
+    DISCOVERY_URLS = {
+        'photoslibrary': 'https://photoslibrary.googleapis.com/$discovery/rest?version={version}',
+    }
+    
+    # Refresh access tokens this close to expiry so a run doesn't outlive its token
+    TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
     
     def __init__(self, credentials_file: str = 'credentials.json', token_file: str = 'token.json'):
         """
@@ -30,7 +55,21 @@ class GoogleAuthManager:
         self.credentials_file = Path(credentials_file)
         self.token_file = Path(token_file)
         self.creds: Optional[Credentials] = None
+        self._http_session: Optional['AuthorizedSession'] = None
+        self._auth_request: Optional['Request'] = None
         self.logger = logging.getLogger(__name__)
+        
+        # Background token refresh; at most one in flight
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refresh_future: Optional[Future] = None
+        
+        # Built API services, per thread
+        self._thread_services = threading.local()
+        
+        # Fetched discovery documents, keyed by (api, version)
+        self._discovery_lock = threading.Lock()
+        self._discovery_documents: Dict[Tuple[str, str], str] = {}
     
     def authenticate(self) -> bool:
         """
@@ -40,30 +79,33 @@ class GoogleAuthManager:
             bool: True if authentication successful, False otherwise
         """
         try:
+            # Credentials from an earlier call with time left need no disk access
+            if self.creds and not self._needs_refresh(self.creds):
+                return True
+            
             # Load existing token if available
-            if self.token_file.exists():
-                self.creds = Credentials.from_authorized_user_file(str(self.token_file), self.SCOPES)
+            if self.creds is None and self.token_file.exists():
+                self.creds = Credentials.from_authorized_user_file(str(self.token_file), list(self.SCOPES))
             
-            # If no valid credentials, initiate OAuth flow
-            if not self.creds or not self.creds.valid:
-                if self.creds and self.creds.expired and self.creds.refresh_token:
-                    self.logger.info("Refreshing expired credentials")
-                    self.creds.refresh(Request())
+            # A stored access token with time left is reused as-is
+            if not self.creds or self._needs_refresh(self.creds):
+                if self.creds and self.creds.refresh_token:
+                    self._refresh_shared_token()
                 else:
                     if not self.credentials_file.exists():
                         self.logger.error(f"Credentials file not found: {self.credentials_file}")
                         return False
                     
+                    from google_auth_oauthlib.flow import InstalledAppFlow
+                    
                     self.logger.info("Starting OAuth 2.0 flow")
                     flow = InstalledAppFlow.from_client_secrets_file(
-                        str(self.credentials_file), self.SCOPES
+                        str(self.credentials_file), list(self.SCOPES)
                     )
                     self.creds = flow.run_local_server(port=0)
                 
                 # Save credentials for next run
-                with open(self.token_file, 'w') as token:
-                    token.write(self.creds.to_json())
-                    self.logger.info(f"Credentials saved to {self.token_file}")
+                self._save_token()
             
             return True
             
@@ -71,23 +113,248 @@ class GoogleAuthManager:
             self.logger.error(f"Authentication failed: {str(e)}")
             return False
     
+    def load_saved_credentials(self) -> bool:
+        """
+        Load the stored token without starting an interactive OAuth flow.
+        
+        Credentials that are expired or close to expiry are refreshed and
+        saved back to the token file; otherwise the stored access token is
+        reused without contacting the token endpoint.
+        
+        Returns:
+            bool: True if valid credentials are loaded, False otherwise
+        """
+        try:
+            if not self.token_file.exists():
+                return False
+            
+            self.creds = Credentials.from_authorized_user_file(str(self.token_file), list(self.SCOPES))
+            if self._needs_refresh(self.creds) and self.creds.refresh_token:
+                self._refresh_shared_token()
+            
+            return self.creds.valid
+            
+        except Exception as e:
+            self.logger.error(f"Failed to load saved credentials: {str(e)}")
+            return False
+    
+    def _needs_refresh(self, creds: Credentials) -> bool:
+        """Check whether credentials are invalid or within TOKEN_REFRESH_MARGIN of expiry."""
+        if not creds.valid:
+            return True
+        if creds.expiry is None:
+            return False
+        # google-auth stores expiry as naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return creds.expiry - now < self.TOKEN_REFRESH_MARGIN
+    
+    def _maybe_refresh_async(self) -> None:
+        """Start a background token refresh when the access token is close to expiry."""
+        if not self.creds or not self.creds.refresh_token or not self._needs_refresh(self.creds):
+            return
+        
+        with self._refresh_lock:
+            if self._refresh_future is not None and not self._refresh_future.done():
+                return
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='token-refresh')
+            self._refresh_future = self._refresh_executor.submit(self._refresh_credentials)
+    
+    def _refresh_credentials(self) -> None:
+        """Refresh and persist credentials, logging rather than raising on failure."""
+        try:
+            self.logger.debug("Refreshing credentials ahead of expiry")
+            self._refresh_shared_token()
+        except Exception as e:
+            # API calls still refresh on demand if this fails
+            self.logger.warning(f"Background credential refresh failed: {str(e)}")
+    
+    def _refresh_shared_token(self) -> None:
+        """
+        Refresh credentials unless another process already did.
+        
+        Workers sharing a token file take an exclusive lock and re-read the
+        token first, so only the first one to get the lock calls the token
+        endpoint and the rest pick up its result from disk.
+        """
+        with self._token_file_lock():
+            if self.token_file.exists():
+                stored_creds = Credentials.from_authorized_user_file(str(self.token_file), list(self.SCOPES))
+                if not self._needs_refresh(stored_creds):
+                    self.logger.debug("Using credentials refreshed by another process")
+                    self.creds = stored_creds
+                    return
+            
+            self.logger.info("Refreshing expiring credentials")
+            self.creds.refresh(self._get_auth_request())
+            self._save_token()
+    
+    def _get_auth_request(self) -> 'Request':
+        """
+        Get the transport used for token refreshes.
+        
+        One requests.Session backs every refresh, so later refreshes reuse
+        the keep-alive connection to the token endpoint.
+        """
+        if self._auth_request is None:
+            import requests
+            from google.auth.transport.requests import Request
+            
+            self._auth_request = Request(session=requests.Session())
+        return self._auth_request
+    
+    @contextmanager
+    def _token_file_lock(self):
+        """
+        Hold an exclusive OS lock shared by all processes using this token file.
+        
+        The lock lives in a sidecar file because the token file itself is
+        replaced on every save.
+        """
+        lock_path = self.token_file.with_name(self.token_file.name + '.lock')
+        with open(lock_path, 'a+b') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    
+    def _save_token(self) -> None:
+        """Write the token file atomically so concurrent runs never read a partial file."""
+        token_json = self.creds.to_json().encode('utf-8')
+        try:
+            if self.token_file.read_bytes() == token_json:
+                self.logger.debug(f"Token unchanged, not rewriting {self.token_file}")
+                return
+        except FileNotFoundError:
+            pass
+        
+        # mkstemp creates the file with 0600 permissions, kept by os.replace
+        fd, tmp_path = tempfile.mkstemp(dir=self.token_file.parent, prefix='.token-', suffix='.json')
+        try:
+            with os.fdopen(fd, 'wb') as token:
+                token.write(token_json)
+            os.replace(tmp_path, self.token_file)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        self.logger.info(f"Credentials saved to {self.token_file}")
+    
     def get_drive_service(self):
         """Get authenticated Google Drive service."""
-        if not self.creds:
-            raise RuntimeError("Not authenticated. Call authenticate() first.")
-        return build('drive', 'v3', credentials=self.creds)
+        return self._get_service('drive', 'v3')
     
     def get_photos_service(self):
         """Get authenticated Google Photos Library service."""
-        if not self.creds:
-            raise RuntimeError("Not authenticated. Call authenticate() first.")
-        return build('photoslibrary', 'v1', credentials=self.creds)
+        return self._get_service('photoslibrary', 'v1')
     
     def get_vision_service(self):
         """Get authenticated Google Cloud Vision service."""
+        return self._get_service('vision', 'v1')
+    
+    def _get_service(self, api_name: str, api_version: str):
+        """
+        Get a memoized API service for the calling thread.
+        
+        Services are cached per thread because each wraps an httplib2
+        connection, which is not thread-safe. A cache built for credentials
+        that have since been replaced is discarded.
+        
+        Args:
+            api_name: Google API name
+            api_version: Google API version
+            
+        Returns:
+            googleapiclient Resource for the API
+        """
         if not self.creds:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
-        return build('vision', 'v1', credentials=self.creds)
+        self._maybe_refresh_async()
+        
+        cache = self._thread_services
+        if getattr(cache, 'creds', None) is not self.creds:
+            cache.creds = self.creds
+            cache.services = {}
+        
+        service = cache.services.get(api_name)
+        if service is None:
+            service = self._build_service(api_name, api_version)
+            cache.services[api_name] = service
+        return service
+    
+    def _build_service(self, api_name: str, api_version: str):
+        """
+        Build an API service without per-build discovery lookups.
+        
+        APIs bundled with the client library use its static discovery
+        documents. Others have their document fetched once and reused.
+        
+        Args:
+            api_name: Google API name
+            api_version: Google API version
+            
+        Returns:
+            googleapiclient Resource for the API
+        """
+        from googleapiclient.discovery import build, build_from_document
+        
+        if api_name not in self.DISCOVERY_URLS:
+            return build(api_name, api_version, credentials=self.creds,
+                         static_discovery=True, cache_discovery=False)
+        
+        key = (api_name, api_version)
+        with self._discovery_lock:
+            document = self._discovery_documents.get(key)
+            if document is None:
+                response = self.get_http_session().get(self.DISCOVERY_URLS[api_name].format(version=api_version))
+                response.raise_for_status()
+                document = response.text
+                self._discovery_documents[key] = document
+        
+        return build_from_document(document, credentials=self.creds)
+    
+    def get_http_session(self) -> 'AuthorizedSession':
+        """
+        Get a shared authorized HTTP session for raw downloads.
+        
+        The session keeps a pool of keep-alive connections, so repeated
+        requests to the same host reuse TLS connections instead of
+        handshaking for every file. Rate-limit and server errors are
+        retried with exponential backoff, honoring Retry-After.
+        
+        Returns:
+            AuthorizedSession: Session that adds OAuth credentials to requests
+        """
+        if not self.creds:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+        if self._http_session is None:
+            from google.auth.transport.requests import AuthorizedSession
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = AuthorizedSession(self.creds, auth_request=self._get_auth_request())
+            retry = Retry(
+                total=5,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+            adapter = HTTPAdapter(
+                pool_connections=self.HTTP_POOL_SIZE,
+                pool_maxsize=self.HTTP_POOL_SIZE,
+                max_retries=retry
+            )
+            session.mount('https://', adapter)
+            self._http_session = session
+        return self._http_session
     
     def is_authenticated(self) -> bool:
         """Check if currently authenticated with valid credentials."""
@@ -96,11 +363,14 @@ class GoogleAuthManager:
     def revoke_credentials(self) -> bool:
         """Revoke stored credentials and delete token file."""
         try:
-            if self.token_file.exists():
-                os.remove(self.token_file)
-                self.logger.info("Token file deleted")
+            self.token_file.unlink(missing_ok=True)
+            self.logger.info("Token file deleted")
             
             self.creds = None
+            self._thread_services = threading.local()
+            if self._http_session is not None:
+                self._http_session.close()
+                self._http_session = None
             return True
             
         except Exception as e:
@@ -1,20 +1,238 @@
+import os
+import re
 import logging
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import json
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import astuple
+import orjson
 
 from .spreadsheet_exporter import SpreadsheetExporter
 from .data_formatter import DataFormatter, FormattingOptions
 from .export_templates import ExportTemplateManager, ExportTemplate
 from .report_generator import ReportGenerator
 from ..utils.config import ExportConfig
+from ..utils.fileio import json_dump_options, write_bytes
+
+
+# Keyword groups for item categorization (substring matches on descriptions)
+_MEALS_RE = re.compile(r'meal|food|restaurant|lunch|dinner', re.IGNORECASE)
+_MEALS_ACCOUNTING_RE = re.compile(r'meal|food|restaurant', re.IGNORECASE)
+_TRAVEL_RE = re.compile(r'gas|fuel|station', re.IGNORECASE)
+_FUEL_RE = re.compile(r'gas|fuel', re.IGNORECASE)
+_OFFICE_RE = re.compile(r'office|supply|paper|pen', re.IGNORECASE)
+_OFFICE_ACCOUNTING_RE = re.compile(r'office|supply', re.IGNORECASE)
+_MEDICAL_RE = re.compile(r'medical|pharmacy|doctor', re.IGNORECASE)
+_BUSINESS_RE = re.compile(r'office|business', re.IGNORECASE)
+_CHARITY_RE = re.compile(r'donation|charity', re.IGNORECASE)
+
+# str.translate table deleting every non-digit ASCII character
+_ASCII_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(field_path: str) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Build an accessor for a dot-notation field path, once per path.
+    
+    Args:
+        field_path: Path such as 'merchant.name'
+        
+    Returns:
+        Callable returning the nested value, or None if any step is missing
+    """
+    if '.' not in field_path:
+        # Most template fields are top-level keys
+        def get_flat(data: Dict[str, Any]) -> Any:
+            return data.get(field_path) if isinstance(data, dict) else None
+        
+        return get_flat
+    
+    keys = tuple(field_path.split('.'))
+    
+    def get(data: Dict[str, Any]) -> Any:
+        value = data
+        for key in keys:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+            if value is None:
+                return None
+        return value
+    
+    return get
+
+
+def _fmt_currency(value: Any) -> str:
+    """Format a number or numeric string as dollars."""
+    if isinstance(value, (int, float)):
+        return f"${value:.2f}"
+    elif isinstance(value, str) and value.replace('.', '').replace(',', '').isdigit():
+        return f"${float(value):.2f}"
+    return str(value)
+
+
+def _fmt_percentage(value: Any) -> str:
+    """Format a ratio as a percentage."""
+    if isinstance(value, (int, float)):
+        return f"{value:.1%}"
+    elif isinstance(value, str) and '%' in value:
+        return value
+    return str(value)
+
+
+def _fmt_boolean(value: Any) -> str:
+    """Format a truthy value as Yes/No."""
+    if isinstance(value, bool):
+        return 'Yes' if value else 'No'
+    elif isinstance(value, str):
+        return 'Yes' if value.lower() in ['true', 'yes', '1'] else 'No'
+    return str(value)
+
+
+def _fmt_items_summary(value: Any) -> str:
+    """Summarize the first few item descriptions."""
+    if isinstance(value, list) and value:
+        descriptions = [item.get('description', '') for item in value if item.get('description')]
+        return '; '.join(descriptions[:3])  # First 3 items
+    return ''
+
+
+def _fmt_items_business(value: Any) -> str:
+    """Categorize items into business expense groups."""
+    # For business purposes, might categorize items
+    if isinstance(value, list) and value:
+        # Simple categorization based on common business items
+        categories = set()
+        for item in value:
+            desc = item.get('description', '')
+            if _MEALS_RE.search(desc):
+                categories.add('Meals')
+            elif _TRAVEL_RE.search(desc):
+                categories.add('Travel')
+            elif _OFFICE_RE.search(desc):
+                categories.add('Office Supplies')
+            else:
+                categories.add('General')
+        return '; '.join(categories)
+    return 'General'
+
+
+def _fmt_tax_category(value: Any) -> str:
+    """Pick a tax category from the item descriptions."""
+    # Simplified tax categorization
+    if isinstance(value, list) and value:
+        # Look for tax-relevant categories
+        for item in value:
+            desc = item.get('description', '')
+            if _MEDICAL_RE.search(desc):
+                return 'Medical'
+            elif _BUSINESS_RE.search(desc):
+                return 'Business Expense'
+            elif _CHARITY_RE.search(desc):
+                return 'Charitable'
+    return 'General'
+
+
+def _fmt_accounting_code(value: Any) -> str:
+    """Pick an accounting code from the item descriptions."""
+    # Simple accounting code assignment
+    if isinstance(value, list) and value:
+        # Basic account code mapping
+        for item in value:
+            desc = item.get('description', '')
+            if _MEALS_ACCOUNTING_RE.search(desc):
+                return '6200'  # Meals & Entertainment
+            elif _FUEL_RE.search(desc):
+                return '6100'  # Travel
+            elif _OFFICE_ACCOUNTING_RE.search(desc):
+                return '6300'  # Office Supplies
+    return '6000'  # General Expense
+
+
+def _fmt_phone(value: Any) -> str:
+    """Format a 10-digit phone number."""
+    # Format phone number
+    if isinstance(value, str):
+        if value.isascii():
+            digits = value.translate(_ASCII_NON_DIGITS)
+        else:
+            digits = ''.join(filter(str.isdigit, value))
+        if len(digits) == 10:
+            return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+    return str(value)
+
+
+# Field formatters by template name; unknown formatters fall back to str()
+_FORMATTERS: Dict[str, Callable[[Any], str]] = {
+    'currency': _fmt_currency,
+    'percentage': _fmt_percentage,
+    'boolean': _fmt_boolean,
+    'items_summary': _fmt_items_summary,
+    'items_business': _fmt_items_business,
+    'tax_category': _fmt_tax_category,
+    'accounting_code': _fmt_accounting_code,
+    'phone': _fmt_phone,
+}
+
+
+class _FormattedReceiptsCache:
+    """Formatted receipts for one OCR result set, computed once per distinct FormattingOptions."""
+    
+    def __init__(self, ocr_results: List[Dict[str, Any]]):
+        self.ocr_results = ocr_results
+        self._lock = threading.Lock()
+        self._results: Dict[tuple, Future] = {}
+    
+    def get(self, options: FormattingOptions) -> List[Dict[str, Any]]:
+        """
+        Get receipts formatted with the given options.
+        
+        Concurrent callers asking for the same options wait for the first
+        caller's result rather than formatting again.
+        
+        Args:
+            options: Template formatting options
+            
+        Returns:
+            List of formatted receipts
+        """
+        key = astuple(options)
+        with self._lock:
+            future = self._results.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._results[key] = future
+        
+        if owner:
+            try:
+                formatted = DataFormatter(options).format_receipts_for_export(self.ocr_results)
+                future.set_result(formatted['formatted_receipts'])
+            except Exception as e:
+                future.set_exception(e)
+        
+        return future.result()
 
 
 class BatchExporter:
     """Handles batch export operations with multiple formats and templates."""
     
+    # Write buffer for template CSV files
+    CSV_BUFFER_SIZE = 1 << 20
+    
+    # Concurrent unlinks when cleaning up old exports
+    CLEANUP_WORKERS = 16
+    
+    # Most recent export operations kept in memory
+    EXPORT_HISTORY_SIZE = 100
+    
     def __init__(self, config: ExportConfig):
         """
         Initialize batch exporter.
@@ -24,6 +242,9 @@ class BatchExporter:
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self._output_dir = Path(config.output_directory)
+        
+        self._json_options = json_dump_options(config.pretty_json)
         
         # Initialize components
         self.spreadsheet_exporter = SpreadsheetExporter(config)
@@ -31,7 +252,12 @@ class BatchExporter:
         self.report_generator = ReportGenerator(config.output_directory + "/reports")
         
         # Track export operations
-        self.export_history = []
+        self.export_history = deque(maxlen=self.EXPORT_HISTORY_SIZE)
+        
+        # Background JSON writes; flush() waits for them
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='export-io')
+        self._pending_lock = threading.Lock()
+        self._pending_writes: List[Tuple[str, Future]] = []
     
     def export_with_multiple_templates(self, ocr_results: List[Dict[str, Any]], 
                                      source_name: str,
@@ -62,6 +288,9 @@ class BatchExporter:
                     else:
                         self.logger.warning(f"Template not found: {name}")
             
+            # A template listed twice would race itself onto the same filenames
+            templates = list({template.name: template for template in templates}.values())
+            
             if not templates:
                 return {
                     'success': False,
@@ -69,21 +298,41 @@ class BatchExporter:
                     'exports': []
                 }
             
-            # Export with each template
-            export_results = []
+            # Templates export independently, so run them concurrently
+            export_results = [None] * len(templates)
+            max_workers = min(len(templates), os.cpu_count() or 4)
             
-            for template in templates:
-                try:
-                    result = self._export_with_template(ocr_results, source_name, template)
-                    export_results.append(result)
-                except Exception as e:
-                    self.logger.error(f"Export failed for template {template.name}: {str(e)}")
-                    export_results.append({
-                        'template_name': template.name,
-                        'success': False,
-                        'error': str(e),
-                        'exported_files': []
-                    })
+            # Templates with identical formatting options share one formatting pass
+            formatted_cache = _FormattedReceiptsCache(ocr_results)
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._export_with_template, ocr_results, source_name, template,
+                                    formatted_cache): index
+                    for index, template in enumerate(templates)
+                }
+                
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        export_results[index] = future.result()
+                    except Exception as e:
+                        template = templates[index]
+                        self.logger.error(f"Export failed for template {template.name}: {str(e)}")
+                        export_results[index] = {
+                            'template_name': template.name,
+                            'success': False,
+                            'error': str(e),
+                            'exported_files': []
+                        }
+            
+            # JSON files are written in the background; drop any that failed
+            failed_writes = self.flush()
+            if failed_writes:
+                for result in export_results:
+                    files = [f for f in result.get('exported_files', []) if f not in failed_writes]
+                    result['exported_files'] = files
+                    result['success'] = result.get('success', False) and bool(files)
             
             # Generate summary
             successful_exports = [r for r in export_results if r.get('success')]
@@ -107,191 +356,129 @@ class BatchExporter:
             }
     
     def _export_with_template(self, ocr_results: List[Dict[str, Any]], 
-                            source_name: str, template: ExportTemplate) -> Dict[str, Any]:
+                            source_name: str, template: ExportTemplate,
+                            formatted_cache: Optional['_FormattedReceiptsCache'] = None) -> Dict[str, Any]:
         """Export data using a specific template."""
-        # Create data formatter with template formatting options
-        formatter = DataFormatter(template.formatting)
-        
-        # Format data according to template
-        formatted_data = formatter.format_receipts_for_export(ocr_results)
+        # Format data according to template formatting options
+        if formatted_cache is None:
+            formatted_cache = _FormattedReceiptsCache(ocr_results)
+        formatted_receipts = formatted_cache.get(template.formatting)
         
         # Apply template field mappings
-        mapped_data = self._apply_template_mappings(formatted_data['formatted_receipts'], template)
+        fieldnames, mapped_data = self._apply_template_mappings(formatted_receipts, template)
         
-        # Export in template formats
+        # Each format is written to its own file, so write them concurrently
+        writers = {
+            'csv': self._export_template_csv,
+            'xlsx': self._export_template_excel,
+            'json': self._export_template_json
+        }
+        template_name = template.name
+        export_formats = template.export_formats
+        formats = [f for f in export_formats if f.lower() in writers]
         exported_files = []
         
-        for format_type in template.export_formats:
-            try:
-                if format_type.lower() == 'csv':
-                    file_path = self._export_template_csv(mapped_data, source_name, template)
-                    exported_files.append(file_path)
-                    
-                elif format_type.lower() == 'xlsx':
-                    file_path = self._export_template_excel(mapped_data, source_name, template)
-                    exported_files.append(file_path)
-                    
-                elif format_type.lower() == 'json':
-                    file_path = self._export_template_json(mapped_data, source_name, template)
-                    exported_files.append(file_path)
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to export {format_type} for template {template.name}: {str(e)}")
+        # One file stem per template export, shared by all of its formats
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        slug = template_name.lower().replace(' ', '_')
+        file_stem = f"{slug}_{source_name}_{timestamp}"
+        
+        if formats:
+            with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+                futures = {
+                    executor.submit(writers[format_type.lower()], mapped_data, fieldnames, file_stem, template): index
+                    for index, format_type in enumerate(formats)
+                }
+                written = [None] * len(formats)
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        written[index] = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Failed to export {formats[index]} for template {template_name}: {str(e)}")
+            
+            exported_files = [file_path for file_path in written if file_path]
         
         return {
-            'template_name': template.name,
+            'template_name': template_name,
             'template_type': template.template_type.value,
             'success': len(exported_files) > 0,
             'exported_files': exported_files,
-            'formats': template.export_formats,
+            'formats': export_formats,
             'receipts_processed': len(mapped_data)
         }
     
     def _apply_template_mappings(self, receipts: List[Dict[str, Any]], 
-                               template: ExportTemplate) -> List[Dict[str, Any]]:
-        """Apply template field mappings to receipt data."""
-        mapped_receipts = []
+                               template: ExportTemplate) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Apply template field mappings to receipt data.
+        
+        Returns:
+            Tuple of (column names in export order, mapped receipt rows)
+        """
+        fieldnames = [fm.export_name for fm in template.fields]
+        if template.business_fields:
+            fieldnames.extend(name for name in template.business_fields if name not in fieldnames)
+        
+        mapped_receipts = list(self._iter_mapped(receipts, template))
+        
+        # Apply grouping if specified
+        group_by = template.group_by
+        if group_by:
+            mapped_receipts = self._group_mapped_data(mapped_receipts, group_by)
+        
+        # Apply sorting
+        mapped_receipts = self._sort_mapped_data(mapped_receipts, template.sort_by)
+        
+        return fieldnames, mapped_receipts
+    
+    def _iter_mapped(self, receipts: Iterable[Dict[str, Any]], 
+                     template: ExportTemplate) -> Iterator[Dict[str, Any]]:
+        """Yield receipts mapped to the template's export fields, one at a time."""
+        business_fields = template.business_fields or {}
+        apply_formatter = self._apply_field_formatter
+        
+        # Every row starts as a copy of this: export columns in template order,
+        # then business fields, which take precedence over mapped values
+        base_row = dict.fromkeys(fm.export_name for fm in template.fields)
+        base_row.update(business_fields)
+        
+        # Resolve field paths once rather than per receipt
+        accessors = [
+            (fm.export_name, _compile_path(fm.source_field), fm.default_value, fm.formatter)
+            for fm in template.fields
+            if fm.export_name not in business_fields
+        ]
         
         for receipt in receipts:
-            mapped_receipt = {}
+            mapped_receipt = base_row.copy()
             
-            for field_mapping in template.fields:
-                # Extract value using field path
-                value = self._get_nested_value(receipt, field_mapping.source_field)
+            for export_name, get_value, default_value, formatter in accessors:
+                value = get_value(receipt)
                 
                 # Apply default if value is empty and default is specified
-                if not value and field_mapping.default_value:
-                    value = field_mapping.default_value
+                if not value and default_value:
+                    value = default_value
                 
                 # Apply formatter if specified
-                if value and field_mapping.formatter:
-                    value = self._apply_field_formatter(value, field_mapping.formatter)
+                if value and formatter:
+                    value = apply_formatter(value, formatter)
                 
-                # Store with export name
-                mapped_receipt[field_mapping.export_name] = value
+                mapped_receipt[export_name] = value
             
-            # Add business fields if template has them
-            if template.business_fields:
-                mapped_receipt.update(template.business_fields)
-            
-            mapped_receipts.append(mapped_receipt)
-        
-        # Apply grouping if specified
-        if template.group_by:
-            mapped_receipts = self._group_mapped_data(mapped_receipts, template.group_by)
-        
-        # Apply sorting
-        mapped_receipts = self._sort_mapped_data(mapped_receipts, template.sort_by)
-        
-        return mapped_receipts
+            yield mapped_receipt
     
     def _get_nested_value(self, data: Dict[str, Any], field_path: str) -> Any:
         """Get value from nested dictionary using dot notation."""
         try:
-            keys = field_path.split('.')
-            value = data
-            
-            for key in keys:
-                if isinstance(value, dict):
-                    value = value.get(key)
-                else:
-                    return None
-                
-                if value is None:
-                    return None
-            
-            return value
-            
+            return _compile_path(field_path)(data)
         except Exception:
             return None
     
     def _apply_field_formatter(self, value: Any, formatter: str) -> str:
         """Apply formatting to field value."""
         try:
-            if formatter == 'currency':
-                if isinstance(value, (int, float)):
-                    return f"${value:.2f}"
-                elif isinstance(value, str) and value.replace('.', '').replace(',', '').isdigit():
-                    return f"${float(value):.2f}"
-                return str(value)
-                
-            elif formatter == 'percentage':
-                if isinstance(value, (int, float)):
-                    return f"{value:.1%}"
-                elif isinstance(value, str) and '%' in value:
-                    return value
-                return str(value)
-                
-            elif formatter == 'boolean':
-                if isinstance(value, bool):
-                    return 'Yes' if value else 'No'
-                elif isinstance(value, str):
-                    return 'Yes' if value.lower() in ['true', 'yes', '1'] else 'No'
-                return str(value)
-                
-            elif formatter == 'items_summary':
-                if isinstance(value, list) and value:
-                    descriptions = [item.get('description', '') for item in value if item.get('description')]
-                    return '; '.join(descriptions[:3])  # First 3 items
-                return ''
-                
-            elif formatter == 'items_business':
-                # For business purposes, might categorize items
-                if isinstance(value, list) and value:
-                    # Simple categorization based on common business items
-                    categories = set()
-                    for item in value:
-                        desc = item.get('description', '').lower()
-                        if any(word in desc for word in ['meal', 'food', 'restaurant', 'lunch', 'dinner']):
-                            categories.add('Meals')
-                        elif any(word in desc for word in ['gas', 'fuel', 'station']):
-                            categories.add('Travel')
-                        elif any(word in desc for word in ['office', 'supply', 'paper', 'pen']):
-                            categories.add('Office Supplies')
-                        else:
-                            categories.add('General')
-                    return '; '.join(categories)
-                return 'General'
-                
-            elif formatter == 'tax_category':
-                # Simplified tax categorization
-                if isinstance(value, list) and value:
-                    # Look for tax-relevant categories
-                    for item in value:
-                        desc = item.get('description', '').lower()
-                        if any(word in desc for word in ['medical', 'pharmacy', 'doctor']):
-                            return 'Medical'
-                        elif any(word in desc for word in ['office', 'business']):
-                            return 'Business Expense'
-                        elif any(word in desc for word in ['donation', 'charity']):
-                            return 'Charitable'
-                return 'General'
-                
-            elif formatter == 'accounting_code':
-                # Simple accounting code assignment
-                if isinstance(value, list) and value:
-                    # Basic account code mapping
-                    for item in value:
-                        desc = item.get('description', '').lower()
-                        if any(word in desc for word in ['meal', 'food', 'restaurant']):
-                            return '6200'  # Meals & Entertainment
-                        elif any(word in desc for word in ['gas', 'fuel']):
-                            return '6100'  # Travel
-                        elif any(word in desc for word in ['office', 'supply']):
-                            return '6300'  # Office Supplies
-                return '6000'  # General Expense
-                
-            elif formatter == 'phone':
-                # Format phone number
-                if isinstance(value, str):
-                    digits = ''.join(filter(str.isdigit, value))
-                    if len(digits) == 10:
-                        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-                return str(value)
-                
-            else:
-                return str(value)
-                
+            return _FORMATTERS.get(formatter, str)(value)
         except Exception:
             return str(value) if value else ''
     
@@ -299,72 +486,109 @@ class BatchExporter:
         """Group mapped data by specified field."""
         # For now, just return sorted by group field
         # Could be enhanced to create actual groups
-        return sorted(data, key=lambda x: x.get(group_by, ''))
+        return sorted(data, key=self._row_key(data, group_by))
     
     def _sort_mapped_data(self, data: List[Dict[str, Any]], sort_by: str) -> List[Dict[str, Any]]:
         """Sort mapped data by specified field."""
         try:
-            return sorted(data, key=lambda x: x.get(sort_by, ''))
+            return sorted(data, key=self._row_key(data, sort_by))
         except Exception:
             return data
     
-    def _export_template_csv(self, mapped_data: List[Dict[str, Any]], 
-                           source_name: str, template: ExportTemplate) -> str:
+    def _row_key(self, data: List[Dict[str, Any]], field: str) -> Callable[[Dict[str, Any]], Any]:
+        """Get a sort key for a field, using C-level itemgetter when every row has it."""
+        if all(field in row for row in data):
+            return itemgetter(field)
+        return lambda row: row.get(field, '')
+    
+    def _export_template_csv(self, mapped_data: List[Dict[str, Any]], fieldnames: List[str],
+                           file_stem: str, template: ExportTemplate) -> str:
         """Export template data as CSV."""
         import csv
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{template.name.lower().replace(' ', '_')}_{source_name}_{timestamp}.csv"
-        file_path = Path(self.config.output_directory) / filename
+        file_path = self._output_dir / f"{file_stem}.csv"
         
         if mapped_data:
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = mapped_data[0].keys()
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(mapped_data)
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=self.CSV_BUFFER_SIZE) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
+                # Rows are aligned to the header here instead of per-cell by DictWriter
+                writer.writerows(
+                    tuple(row.get(name, '') for name in fieldnames) for row in mapped_data
+                )
         
         return str(file_path)
     
-    def _export_template_excel(self, mapped_data: List[Dict[str, Any]], 
-                             source_name: str, template: ExportTemplate) -> str:
+    def _export_template_excel(self, mapped_data: List[Dict[str, Any]], fieldnames: List[str],
+                             file_stem: str, template: ExportTemplate) -> str:
         """Export template data as Excel."""
-        import pandas as pd
+        from openpyxl import Workbook
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{template.name.lower().replace(' ', '_')}_{source_name}_{timestamp}.xlsx"
-        file_path = Path(self.config.output_directory) / filename
+        file_path = self._output_dir / f"{file_stem}.xlsx"
         
         if mapped_data:
-            df = pd.DataFrame(mapped_data)
-            
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name=template.name[:31], index=False)  # Sheet name max 31 chars
+            # Write-only workbooks stream rows to disk instead of keeping a cell object per value
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet(title=template.name[:31])  # Sheet name max 31 chars
+            ws.append(fieldnames)
+            for row in mapped_data:
+                ws.append([self._excel_value(row.get(name)) for name in fieldnames])
+            wb.save(file_path)
         
         return str(file_path)
     
-    def _export_template_json(self, mapped_data: List[Dict[str, Any]], 
-                            source_name: str, template: ExportTemplate) -> str:
+    def _excel_value(self, value: Any) -> Any:
+        """Convert a mapped value into something openpyxl can store in a cell."""
+        if value is None or isinstance(value, (str, int, float, bool, datetime)):
+            return value
+        return str(value)
+    
+    def _export_template_json(self, mapped_data: List[Dict[str, Any]], fieldnames: List[str],
+                            file_stem: str, template: ExportTemplate) -> str:
         """Export template data as JSON."""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{template.name.lower().replace(' ', '_')}_{source_name}_{timestamp}.json"
-        file_path = Path(self.config.output_directory) / filename
+        file_path = self._output_dir / f"{file_stem}.json"
         
         export_data = {
             'template_info': {
                 'name': template.name,
                 'description': template.description,
                 'type': template.template_type.value,
+                'fields': fieldnames,
                 'exported_at': datetime.now().isoformat()
             },
             'data': mapped_data
         }
         
-        with open(file_path, 'w', encoding='utf-8') as jsonfile:
-            json.dump(export_data, jsonfile, indent=2, ensure_ascii=False, default=str)
+        # Serializing and writing doesn't need to hold up the next export
+        future = self._io_pool.submit(self._write_json, file_path, export_data)
+        with self._pending_lock:
+            self._pending_writes.append((str(file_path), future))
         
         return str(file_path)
     
+    def _write_json(self, file_path: Path, export_data: Dict[str, Any]) -> None:
+        """Serialize export data with orjson and write it to a file."""
+        write_bytes(file_path, orjson.dumps(export_data, option=self._json_options, default=str))
+    
+    def flush(self) -> Set[str]:
+        """
+        Wait for background JSON writes to finish.
+        
+        Returns:
+            Set of file paths whose writes failed
+        """
+        with self._pending_lock:
+            pending, self._pending_writes = self._pending_writes, []
+        
+        failed = set()
+        for file_path, future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.error(f"Failed to write JSON export {file_path}: {str(e)}")
+                failed.add(file_path)
+        return failed
+    
     def export_comprehensive_package(self, ocr_results: List[Dict[str, Any]], 
                                    source_name: str,
                                    include_reports: bool = True,
@@ -480,32 +704,33 @@ class BatchExporter:
             export_record['export_types'].append('templates')
         
         self.export_history.append(export_record)
-        
-        # Limit history size
-        if len(self.export_history) > 100:
-            self.export_history = self.export_history[-50:]
     
     def get_export_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent export history."""
-        return self.export_history[-limit:] if self.export_history else []
+        skip = max(0, len(self.export_history) - limit)
+        return list(islice(self.export_history, skip, None))
     
     def cleanup_old_exports(self, days_old: int = 30) -> Dict[str, Any]:
         """Clean up old export files."""
         try:
-            output_dir = Path(self.config.output_directory)
-            cutoff_date = datetime.now() - timedelta(days=days_old)
+            cutoff_ts = (datetime.now() - timedelta(days=days_old)).timestamp()
+            
+            victims = []
+            for entry in self._iter_files(self._output_dir):
+                stat = entry.stat(follow_symlinks=False)
+                if stat.st_mtime < cutoff_ts:
+                    victims.append((entry.path, stat.st_size))
             
+            # Keep many unlinks in flight; latency dominates on network storage
             files_removed = 0
             bytes_freed = 0
-            
-            for file_path in output_dir.rglob('*'):
-                if file_path.is_file():
-                    file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if file_time < cutoff_date:
-                        file_size = file_path.stat().st_size
-                        file_path.unlink()
-                        files_removed += 1
-                        bytes_freed += file_size
+            if victims:
+                with ThreadPoolExecutor(max_workers=min(self.CLEANUP_WORKERS, len(victims))) as executor:
+                    removed = executor.map(self._remove_file, [path for path, _ in victims])
+                    for (path, size), was_removed in zip(victims, removed):
+                        if was_removed:
+                            files_removed += 1
+                            bytes_freed += size
             
             return {
                 'success': True,
@@ -519,4 +744,22 @@ class BatchExporter:
             return {
                 'success': False,
                 'error': str(e)
-            }
\ No newline at end of file
+            }
+    
+    def _remove_file(self, path: str) -> bool:
+        """Delete one file, logging rather than raising on failure."""
+        try:
+            os.unlink(path)
+            return True
+        except OSError as e:
+            self.logger.warning(f"Failed to remove old export {path}: {str(e)}")
+            return False
+    
+    def _iter_files(self, directory: Union[str, Path]) -> Iterator[os.DirEntry]:
+        """Recursively yield file entries under a directory using os.scandir."""
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._iter_files(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
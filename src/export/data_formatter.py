@@ -1,13 +1,65 @@
+import re
+import sys
 import logging
+from collections import defaultdict
+import numpy as np
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, date
 from decimal import Decimal
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ..processing.data_extractor import ReceiptData, ReceiptItem
 
 
-@dataclass
+_NON_DIGITS_RE = re.compile(r'\D')
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w \-]')
+
+
+def _safe_float(value: Any) -> Optional[float]:
+    """
+    Convert a number or numeric string to float without raising.
+    
+    Numeric types take a plain conversion; only strings pay for cleanup
+    and a guarded parse.
+    
+    Returns:
+        The value as a float, or None if it is empty or not numeric
+    """
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int or value_type is Decimal:
+        return float(value)
+    if value is None:
+        return None
+    
+    if value_type is str:
+        # Remove currency symbols and commas
+        value = value.replace('$', '').replace(',', '').strip()
+        if not value:
+            return None
+    
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> Optional[date]:
+    """Parse an ISO date string, or return None if it isn't one."""
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        return None
+
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class FormattingOptions:
     """Options for data formatting."""
     currency_symbol: str = '$'
@@ -35,6 +87,12 @@ class FormattingOptions:
 class DataFormatter:
     """Formats receipt data for export with customizable options."""
     
+    # Formats tried when a date isn't strict ISO (e.g. unpadded '2024-1-5')
+    DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%m-%d-%Y')
+    
+    # Timestamp suffix for export file names
+    FILENAME_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+    
     def __init__(self, options: Optional[FormattingOptions] = None):
         """
         Initialize data formatter.
@@ -44,6 +102,40 @@ class DataFormatter:
         """
         self.options = options or FormattingOptions()
         self.logger = logging.getLogger(__name__)
+        self._compile_format_templates()
+    
+    def _compile_format_templates(self) -> None:
+        """Build the format strings used by the per-value formatters once."""
+        options = self.options
+        amount_spec = f"{{:.{options.decimal_places}f}}"
+        symbol = options.currency_symbol.replace('{', '{{').replace('}', '}}')
+        
+        if not options.include_currency_in_totals:
+            self._currency_template = amount_spec
+        elif options.currency_position == 'before':
+            self._currency_template = symbol + amount_spec
+        else:
+            self._currency_template = amount_spec + symbol
+        
+        self._percentage_template = f"{{:{options.percentage_format}}}"
+        
+        # Bound methods save the attribute lookup on every formatted value
+        self._currency_format = self._currency_template.format
+        self._percentage_format = self._percentage_template.format
+        self._round_digits = options.decimal_places if options.round_amounts else None
+        self._decimal_quantum = Decimal(1).scaleb(-options.decimal_places)
+        
+        # Visibility flags are fixed per formatter, so pick the optional
+        # receipt sections once instead of testing every flag per receipt
+        self._show_confidence = options.show_confidence_scores
+        self._optional_sections = tuple(
+            add_section for enabled, add_section in (
+                (options.show_confidence_scores, self._add_confidence),
+                (options.show_validation_details, self._add_validation),
+                (options.show_raw_text, self._add_raw_text),
+                (options.show_processing_metadata, self._add_processing_metadata),
+            ) if enabled
+        )
     
     def format_receipts_for_export(self, ocr_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -60,19 +152,44 @@ class DataFormatter:
             valid_receipts = self._filter_valid_receipts(ocr_results)
             sorted_receipts = self._sort_receipts(valid_receipts)
             
-            # Format individual receipts
+            group_by_merchant = self.options.group_by_merchant
+            group_by_date = self.options.group_by_date
+            merchant_groups = defaultdict(list)
+            date_groups = defaultdict(list)
+            
+            # Format receipts, collecting summary inputs and groups in the same pass
             formatted_receipts = []
+            raw_values = []
+            merchants: Dict[str, None] = {}
+            dates = []
             for receipt in sorted_receipts:
                 formatted_receipt = self._format_single_receipt(receipt)
+                raw_values.append(formatted_receipt.pop('_raw'))
                 formatted_receipts.append(formatted_receipt)
+                
+                merchant = formatted_receipt['merchant']['name']
+                date_str = formatted_receipt['transaction']['date']
+                if merchant:
+                    merchants[merchant] = None
+                if date_str:
+                    dates.append(date_str)
+                
+                if group_by_merchant:
+                    merchant_groups[merchant or 'Unknown'].append(formatted_receipt)
+                if group_by_date:
+                    date_groups[date_str or 'Unknown'].append(formatted_receipt)
             
             # Generate summary statistics
-            summary = self._generate_summary_statistics(formatted_receipts)
+            summary = self._generate_summary_statistics(raw_values, merchants, dates)
             
             # Group receipts if requested
             grouped_data = None
-            if self.options.group_by_merchant or self.options.group_by_date:
-                grouped_data = self._group_receipts(formatted_receipts)
+            if group_by_merchant or group_by_date:
+                grouped_data = {}
+                if group_by_merchant:
+                    grouped_data['by_merchant'] = dict(merchant_groups)
+                if group_by_date:
+                    grouped_data['by_date'] = dict(date_groups)
             
             return {
                 'formatted_receipts': formatted_receipts,
@@ -89,45 +206,51 @@ class DataFormatter:
     
     def _filter_valid_receipts(self, ocr_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Filter out invalid receipts."""
-        valid_receipts = []
-        
-        for result in ocr_results:
-            if (result.get('success') and 
-                result.get('receipt_data') and 
-                result['receipt_data'].get('confidence_score', 0) > 0):
-                valid_receipts.append(result)
-        
-        return valid_receipts
+        return [
+            result for result in ocr_results
+            if result.get('success')
+            and (receipt_data := result.get('receipt_data'))
+            and receipt_data.get('confidence_score', 0) > 0
+        ]
     
     def _sort_receipts(self, receipts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Sort receipts based on options."""
         sort_key_map = {
-            'date': lambda r: self._get_sort_date(r),
-            'merchant': lambda r: r['receipt_data'].get('merchant_name', '').lower(),
-            'amount': lambda r: float(r['receipt_data'].get('total_amount', 0)) if r['receipt_data'].get('total_amount') else 0,
+            'date': self._get_sort_date,
+            'merchant': lambda r: (r['receipt_data'].get('merchant_name') or '').lower(),
+            'amount': lambda r: _safe_float(r['receipt_data'].get('total_amount')) or 0.0,
             'confidence': lambda r: r['receipt_data'].get('confidence_score', 0)
         }
         
         sort_key = sort_key_map.get(self.options.sort_by, sort_key_map['date'])
         
-        return sorted(receipts, key=sort_key, reverse=not self.options.sort_ascending)
+        # Compute every key up front, then sort positions by the plain key list
+        keys = [sort_key(receipt) for receipt in receipts]
+        order = sorted(range(len(receipts)), key=keys.__getitem__, reverse=not self.options.sort_ascending)
+        return [receipts[index] for index in order]
     
     def _get_sort_date(self, receipt: Dict[str, Any]) -> date:
         """Get date for sorting purposes."""
         receipt_date = receipt['receipt_data'].get('date')
         if isinstance(receipt_date, str):
-            try:
-                return datetime.fromisoformat(receipt_date).date()
-            except:
-                return date.min
+            return _parse_iso_date(receipt_date) or date.min
         elif isinstance(receipt_date, date):
             return receipt_date
         else:
             return date.min
     
     def _format_single_receipt(self, receipt: Dict[str, Any]) -> Dict[str, Any]:
-        """Format a single receipt."""
+        """
+        Format a single receipt.
+        
+        The result carries a '_raw' entry with the numeric total, tax, tip,
+        item count and validation confidence, for the caller to pop before
+        export.
+        """
         receipt_data = receipt['receipt_data']
+        total = self._coerce_amount(receipt_data.get('total_amount'))
+        tax = self._coerce_amount(receipt_data.get('tax_amount'))
+        tip = self._coerce_amount(receipt_data.get('tip_amount'))
         
         formatted = {
             'file_info': {
@@ -146,9 +269,9 @@ class DataFormatter:
             },
             'amounts': {
                 'subtotal': self._format_currency(receipt_data.get('subtotal')),
-                'tax': self._format_currency(receipt_data.get('tax_amount')),
-                'tip': self._format_currency(receipt_data.get('tip_amount')),
-                'total': self._format_currency(receipt_data.get('total_amount')),
+                'tax': self._format_currency(receipt_data.get('tax_amount'), tax),
+                'tip': self._format_currency(receipt_data.get('tip_amount'), tip),
+                'total': self._format_currency(receipt_data.get('total_amount'), total),
             },
             'payment': {
                 'method': receipt_data.get('payment_method', ''),
@@ -159,54 +282,73 @@ class DataFormatter:
                 'items_count': len(receipt_data.get('items', [])),
                 'ocr_method': receipt.get('ocr_method', ''),
                 'processing_time': receipt.get('processing_time', 0),
+            },
+            '_raw': {
+                'total': total,
+                'tax': tax,
+                'tip': tip,
+                'items': len(receipt_data.get('items', [])),
+                'confidence': None,
             }
         }
         
-        # Add confidence scores if enabled
-        if self.options.show_confidence_scores:
-            formatted['confidence'] = {
-                'ocr_confidence': self._format_percentage(receipt.get('ocr_confidence', 0)),
-                'validation_confidence': self._format_percentage(receipt_data.get('confidence_score', 0)),
-                'overall_confidence': self._format_percentage(
-                    (receipt.get('ocr_confidence', 0) + receipt_data.get('confidence_score', 0)) / 2
-                )
-            }
-        
-        # Add validation details if enabled
-        if self.options.show_validation_details and 'validation' in receipt:
-            validation = receipt['validation']
-            formatted['validation'] = {
-                'is_valid': validation.get('is_valid', False),
-                'confidence_score': self._format_percentage(validation.get('confidence_score', 0)),
-                'issues_count': len(validation.get('issues', [])),
-                'warnings_count': len(validation.get('warnings', [])),
-            }
-            
-            # Include detailed issues if requested
-            if validation.get('issues'):
-                formatted['validation']['issues'] = [
-                    {
-                        'type': issue.get('type', ''),
-                        'severity': issue.get('severity', ''),
-                        'message': issue.get('message', '')
-                    }
-                    for issue in validation['issues']
-                ]
-        
-        # Add raw text if enabled
-        if self.options.show_raw_text:
-            formatted['raw_text'] = receipt.get('raw_text', '')
-        
-        # Add processing metadata if enabled
-        if self.options.show_processing_metadata:
-            formatted['processing'] = {
-                'quality_metrics': receipt.get('quality_metrics', {}),
-                'preprocessing_applied': receipt.get('preprocessing_applied', False),
-                'processing_timestamp': receipt.get('processing_timestamp', ''),
-            }
+        # Add the optional sections enabled in the options
+        for add_section in self._optional_sections:
+            add_section(formatted, receipt, receipt_data)
         
         return formatted
     
+    def _add_confidence(self, formatted: Dict[str, Any], receipt: Dict[str, Any],
+                        receipt_data: Dict[str, Any]) -> None:
+        """Add confidence scores to a formatted receipt."""
+        formatted['_raw']['confidence'] = _safe_float(receipt_data.get('confidence_score', 0))
+        formatted['confidence'] = {
+            'ocr_confidence': self._format_percentage(receipt.get('ocr_confidence', 0)),
+            'validation_confidence': self._format_percentage(receipt_data.get('confidence_score', 0)),
+            'overall_confidence': self._format_percentage(
+                (receipt.get('ocr_confidence', 0) + receipt_data.get('confidence_score', 0)) / 2
+            )
+        }
+    
+    def _add_validation(self, formatted: Dict[str, Any], receipt: Dict[str, Any],
+                        receipt_data: Dict[str, Any]) -> None:
+        """Add validation details to a formatted receipt, if it was validated."""
+        if 'validation' not in receipt:
+            return
+        
+        validation = receipt['validation']
+        formatted['validation'] = {
+            'is_valid': validation.get('is_valid', False),
+            'confidence_score': self._format_percentage(validation.get('confidence_score', 0)),
+            'issues_count': len(validation.get('issues', [])),
+            'warnings_count': len(validation.get('warnings', [])),
+        }
+        
+        # Include detailed issues if requested
+        if validation.get('issues'):
+            formatted['validation']['issues'] = [
+                {
+                    'type': issue.get('type', ''),
+                    'severity': issue.get('severity', ''),
+                    'message': issue.get('message', '')
+                }
+                for issue in validation['issues']
+            ]
+    
+    def _add_raw_text(self, formatted: Dict[str, Any], receipt: Dict[str, Any],
+                      receipt_data: Dict[str, Any]) -> None:
+        """Add the OCR raw text to a formatted receipt."""
+        formatted['raw_text'] = receipt.get('raw_text', '')
+    
+    def _add_processing_metadata(self, formatted: Dict[str, Any], receipt: Dict[str, Any],
+                                 receipt_data: Dict[str, Any]) -> None:
+        """Add processing metadata to a formatted receipt."""
+        formatted['processing'] = {
+            'quality_metrics': receipt.get('quality_metrics', {}),
+            'preprocessing_applied': receipt.get('preprocessing_applied', False),
+            'processing_timestamp': receipt.get('processing_timestamp', ''),
+        }
+    
     def _format_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Format receipt items."""
         formatted_items = []
@@ -219,49 +361,58 @@ class DataFormatter:
                 'total_price': self._format_currency(item.get('total_price')),
             }
             
-            if self.options.show_confidence_scores:
+            if self._show_confidence:
                 formatted_item['confidence'] = self._format_percentage(item.get('confidence', 0))
             
             formatted_items.append(formatted_item)
         
         return formatted_items
     
-    def _format_currency(self, amount: Union[str, float, Decimal, None]) -> str:
-        """Format currency amount."""
+    def _format_currency(self, amount: Union[str, float, Decimal, None],
+                         amount_float: Optional[float] = None) -> str:
+        """
+        Format currency amount.
+        
+        Args:
+            amount: Amount as extracted
+            amount_float: The amount already coerced by _coerce_amount, if available
+        """
+        # Plain numbers, the common case, only need rounding before formatting
+        amount_type = type(amount)
+        if amount_type is float or amount_type is int:
+            if amount_float is None:
+                amount_float = amount if self._round_digits is None else round(amount, self._round_digits)
+            return self._currency_format(amount_float)
+        
         if amount is None or amount == '':
             return ''
         
-        try:
-            # Convert to float
-            if isinstance(amount, str):
-                # Remove currency symbols and commas
-                cleaned = amount.replace('$', '').replace(',', '').strip()
-                if not cleaned:
-                    return ''
-                amount_float = float(cleaned)
-            elif isinstance(amount, Decimal):
-                amount_float = float(amount)
-            else:
-                amount_float = float(amount)
-            
-            # Round if requested
-            if self.options.round_amounts:
-                amount_float = round(amount_float, self.options.decimal_places)
-            
-            # Format with decimal places
-            formatted_amount = f"{amount_float:.{self.options.decimal_places}f}"
-            
-            # Add currency symbol
-            if self.options.include_currency_in_totals:
-                if self.options.currency_position == 'before':
-                    return f"{self.options.currency_symbol}{formatted_amount}"
-                else:
-                    return f"{formatted_amount}{self.options.currency_symbol}"
-            else:
-                return formatted_amount
-                
-        except (ValueError, TypeError):
+        # Decimals round and format natively, without a lossy float round-trip
+        if type(amount) is Decimal and amount.is_finite():
+            if self._round_digits is not None:
+                amount = amount.quantize(self._decimal_quantum)
+            return self._currency_format(amount)
+        
+        if amount_float is None:
+            amount_float = self._coerce_amount(amount)
+        if amount_float is None:
             return str(amount) if amount else ''
+        
+        return self._currency_format(amount_float)
+    
+    def _coerce_amount(self, amount: Union[str, float, Decimal, None]) -> Optional[float]:
+        """
+        Convert an extracted amount to a float, rounded to the display precision.
+        
+        Returns:
+            The amount as a float, or None if it is empty or not numeric
+        """
+        amount_float = _safe_float(amount)
+        
+        # Round if requested
+        if amount_float is not None and self._round_digits is not None:
+            amount_float = round(amount_float, self._round_digits)
+        return amount_float
     
     def _format_date(self, date_value: Union[str, date, None]) -> str:
         """Format date."""
@@ -270,16 +421,15 @@ class DataFormatter:
         
         try:
             if isinstance(date_value, str):
-                # Try to parse ISO format first
-                try:
-                    parsed_date = datetime.fromisoformat(date_value).date()
-                except:
+                # ISO dates (what the extractor emits) need no format loop
+                parsed_date = _parse_iso_date(date_value)
+                if parsed_date is None:
                     # Try other common formats
-                    for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%m-%d-%Y']:
+                    for fmt in self.DATE_FORMATS:
                         try:
                             parsed_date = datetime.strptime(date_value, fmt).date()
                             break
-                        except:
+                        except ValueError:
                             continue
                     else:
                         return date_value  # Return as-is if can't parse
@@ -308,7 +458,7 @@ class DataFormatter:
             return ''
         
         # Simple phone formatting
-        digits = ''.join(filter(str.isdigit, phone))
+        digits = _NON_DIGITS_RE.sub('', phone)
         if len(digits) == 10:
             return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
         elif len(digits) == 11 and digits[0] == '1':
@@ -321,90 +471,68 @@ class DataFormatter:
         if quantity is None or quantity == '':
             return ''
         
-        try:
-            qty_float = float(quantity)
-            # Show as integer if it's a whole number
-            if qty_float == int(qty_float):
-                return str(int(qty_float))
-            else:
-                return f"{qty_float:.2f}"
-        except:
+        qty_float = _safe_float(quantity)
+        if qty_float is None:
             return str(quantity)
+        
+        # Show as integer if it's a whole number
+        if qty_float.is_integer():
+            return str(int(qty_float))
+        return f"{qty_float:.2f}"
     
     def _format_percentage(self, value: Union[float, int, None]) -> str:
         """Format percentage."""
         if value is None:
             return ''
         
-        try:
-            return f"{float(value):{self.options.percentage_format}}"
-        except:
+        value_float = _safe_float(value)
+        if value_float is None:
             return str(value)
+        return self._percentage_format(value_float)
     
-    def _generate_summary_statistics(self, formatted_receipts: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Generate summary statistics."""
-        if not formatted_receipts:
+    def _generate_summary_statistics(self, raw_values: List[Dict[str, Optional[float]]],
+                                     merchants: Dict[str, None], dates: List[str]) -> Dict[str, Any]:
+        """
+        Generate summary statistics.
+        
+        Args:
+            raw_values: Numeric values for each formatted receipt
+            merchants: Distinct merchant names, in first-seen order
+            dates: Formatted transaction dates that are present
+        """
+        if not raw_values:
             return {}
         
-        total_amount = 0.0
-        total_tax = 0.0
-        total_tip = 0.0
-        merchants = set()
-        dates = []
-        item_counts = []
-        confidence_scores = []
-        
-        for receipt in formatted_receipts:
-            # Extract numeric values from formatted currency
-            total_str = receipt['amounts']['total']
-            if total_str:
-                try:
-                    total_amount += float(total_str.replace(self.options.currency_symbol, '').replace(',', ''))
-                except:
-                    pass
-            
-            tax_str = receipt['amounts']['tax']
-            if tax_str:
-                try:
-                    total_tax += float(tax_str.replace(self.options.currency_symbol, '').replace(',', ''))
-                except:
-                    pass
-            
-            tip_str = receipt['amounts']['tip']
-            if tip_str:
-                try:
-                    total_tip += float(tip_str.replace(self.options.currency_symbol, '').replace(',', ''))
-                except:
-                    pass
-            
-            if receipt['merchant']['name']:
-                merchants.add(receipt['merchant']['name'])
-            
-            if receipt['transaction']['date']:
-                dates.append(receipt['transaction']['date'])
-            
-            item_counts.append(receipt['metadata']['items_count'])
-            
-            if self.options.show_confidence_scores and 'confidence' in receipt:
-                conf_str = receipt['confidence']['validation_confidence']
-                try:
-                    conf_val = float(conf_str.replace('%', '')) / 100
-                    confidence_scores.append(conf_val)
-                except:
-                    pass
+        count = len(raw_values)
+        
+        # Missing amounts are NaN so the reductions run entirely in numpy
+        def column(name: str) -> np.ndarray:
+            return np.fromiter(
+                (np.nan if raw[name] is None else raw[name] for raw in raw_values),
+                dtype=np.float64, count=count
+            )
+        
+        total_amount = float(np.nansum(column('total')))
+        total_tax = float(np.nansum(column('tax')))
+        total_tip = float(np.nansum(column('tip')))
+        
+        confidences = column('confidence')
+        confidence_scores = confidences[~np.isnan(confidences)]
+        
+        total_items = int(np.fromiter((raw['items'] for raw in raw_values), dtype=np.int64, count=count).sum())
         
         summary = {
             'totals': {
                 'amount': self._format_currency(total_amount),
                 'tax': self._format_currency(total_tax),
                 'tip': self._format_currency(total_tip),
-                'receipts_count': len(formatted_receipts),
+                'receipts_count': count,
                 'unique_merchants': len(merchants),
-                'total_items': sum(item_counts),
+                'total_items': total_items,
             },
             'averages': {
-                'amount_per_receipt': self._format_currency(total_amount / len(formatted_receipts)) if formatted_receipts else self._format_currency(0),
-                'items_per_receipt': round(sum(item_counts) / len(formatted_receipts), 1) if formatted_receipts else 0,
+                'amount_per_receipt': self._format_currency(total_amount / count),
+                'items_per_receipt': round(total_items / count, 1),
             },
             'date_range': {
                 'earliest': min(dates) if dates else '',
@@ -413,48 +541,32 @@ class DataFormatter:
             'merchants': list(merchants)
         }
         
-        if confidence_scores:
+        if confidence_scores.size:
             summary['quality'] = {
-                'average_confidence': self._format_percentage(sum(confidence_scores) / len(confidence_scores)),
-                'min_confidence': self._format_percentage(min(confidence_scores)),
-                'max_confidence': self._format_percentage(max(confidence_scores)),
+                'average_confidence': self._format_percentage(float(confidence_scores.mean())),
+                'min_confidence': self._format_percentage(float(confidence_scores.min())),
+                'max_confidence': self._format_percentage(float(confidence_scores.max())),
             }
         
         return summary
     
-    def _group_receipts(self, formatted_receipts: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Group receipts by merchant or date."""
-        grouped = {}
-        
-        if self.options.group_by_merchant:
-            merchant_groups = {}
-            for receipt in formatted_receipts:
-                merchant = receipt['merchant']['name'] or 'Unknown'
-                if merchant not in merchant_groups:
-                    merchant_groups[merchant] = []
-                merchant_groups[merchant].append(receipt)
-            grouped['by_merchant'] = merchant_groups
-        
-        if self.options.group_by_date:
-            date_groups = {}
-            for receipt in formatted_receipts:
-                date_str = receipt['transaction']['date'] or 'Unknown'
-                if date_str not in date_groups:
-                    date_groups[date_str] = []
-                date_groups[date_str].append(receipt)
-            grouped['by_date'] = date_groups
-        
-        return grouped
-    
-    def create_export_filename(self, base_name: str, format_type: str, include_timestamp: bool = True) -> str:
-        """Create standardized export filename."""
+    def create_export_filename(self, base_name: str, format_type: str, include_timestamp: bool = True,
+                               now: Optional[datetime] = None) -> str:
+        """
+        Create standardized export filename.
+        
+        Args:
+            base_name: Name to build the filename from
+            format_type: File extension
+            include_timestamp: Whether to append a timestamp
+            now: Timestamp to use, so a batch of exports can share one snapshot
+        """
         # Clean base name
-        clean_name = "".join(c for c in base_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        clean_name = clean_name.replace(' ', '_')
+        clean_name = _UNSAFE_FILENAME_CHARS_RE.sub('', base_name).rstrip().replace(' ', '_')
         
         # Add timestamp if requested
         if include_timestamp:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = (now or datetime.now()).strftime(self.FILENAME_TIMESTAMP_FORMAT)
             filename = f"{clean_name}_{timestamp}.{format_type}"
         else:
             filename = f"{clean_name}.{format_type}"
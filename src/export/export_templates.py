@@ -1,11 +1,66 @@
-import json
+import os
 import logging
+import orjson
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Union
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
-from .data_formatter import FormattingOptions
+from .data_formatter import FormattingOptions, _SLOTS
+from ..utils.fileio import write_bytes
+
+
+@lru_cache(maxsize=64)
+def _template_key(name: str) -> str:
+    """Normalize a template name to its lookup key and file stem."""
+    return name.lower().replace(" ", "_")
+
+
+# Source field paths grouped by receipt section, offered when building templates
+_FIELD_SUGGESTIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "merchant": (
+        "merchant.name",
+        "merchant.address",
+        "merchant.phone"
+    ),
+    "transaction": (
+        "transaction.date",
+        "transaction.time",
+        "transaction.receipt_number"
+    ),
+    "amounts": (
+        "amounts.subtotal",
+        "amounts.tax",
+        "amounts.tip",
+        "amounts.total"
+    ),
+    "payment": (
+        "payment.method",
+        "payment.card_last_four"
+    ),
+    "items": (
+        "items",
+        "metadata.items_count"
+    ),
+    "quality": (
+        "confidence.ocr_confidence",
+        "confidence.validation_confidence",
+        "validation.is_valid"
+    ),
+    "metadata": (
+        "file_info.file_name",
+        "file_info.file_id",
+        "metadata.ocr_method",
+        "metadata.processing_time"
+    )
+})
+
+
+# Export formats a template may list
+_VALID_EXPORT_FORMATS = frozenset({"csv", "xlsx", "json"})
 
 
 class TemplateType(Enum):
@@ -18,9 +73,15 @@ class TemplateType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@lru_cache(maxsize=8)
+def _to_template_type(value: str) -> TemplateType:
+    """Look up a TemplateType by its stored value, memoized per value."""
+    return TemplateType(value)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class FieldMapping:
-    """Mapping configuration for a field."""
+    """Mapping configuration for a field (immutable, so equal mappings can be shared)."""
     source_field: str  # Path to field in receipt data (e.g., "merchant.name")
     export_name: str   # Name in export
     required: bool = False
@@ -29,7 +90,25 @@ class FieldMapping:
     validation_rule: Optional[str] = None
 
 
-@dataclass
+# Shared FieldMapping instances, one per distinct mapping
+_FIELD_MAPPINGS: Dict[FieldMapping, FieldMapping] = {}
+
+
+def _intern_field_mapping(mapping: FieldMapping) -> FieldMapping:
+    """Return the shared instance equal to a FieldMapping, registering it if new."""
+    try:
+        return _FIELD_MAPPINGS.setdefault(mapping, mapping)
+    except TypeError:
+        # Unhashable values (e.g. a list default from a hand-written file)
+        return mapping
+
+
+def _field_mapping(*args, **kwargs) -> FieldMapping:
+    """Create a FieldMapping, reusing an equal existing instance if there is one."""
+    return _intern_field_mapping(FieldMapping(*args, **kwargs))
+
+
+@dataclass(**_SLOTS)
 class ExportTemplate:
     """Template for customizing export format and content."""
     name: str
@@ -63,9 +142,200 @@ class ExportTemplate:
             self.export_formats = ["xlsx"]
 
 
+def _template_to_dict(template: ExportTemplate) -> Dict[str, Any]:
+    """
+    Build the serializable form of a template without asdict's deep copy.
+    
+    Field mappings and formatting options stay dataclass instances, which
+    orjson serializes natively; the enum is stored as its value.
+    """
+    return {
+        "name": template.name,
+        "description": template.description,
+        "template_type": template.template_type.value,
+        "fields": template.fields,
+        "formatting": template.formatting,
+        "include_summary": template.include_summary,
+        "include_items_detail": template.include_items_detail,
+        "group_by": template.group_by,
+        "sort_by": template.sort_by,
+        "export_formats": template.export_formats,
+        "filename_template": template.filename_template,
+        "business_fields": template.business_fields,
+        "custom_calculations": template.custom_calculations,
+    }
+
+
+def _build_builtin_templates() -> Dict[str, ExportTemplate]:
+    """Build the built-in export templates."""
+    templates = {}
+    
+    # Personal expense tracking template
+    templates["personal_expenses"] = ExportTemplate(
+        name="Personal Expenses",
+        description="Template for personal expense tracking",
+        template_type=TemplateType.PERSONAL,
+        fields=[
+            _field_mapping("transaction.date", "Date", required=True, formatter="date"),
+            _field_mapping("merchant.name", "Merchant", required=True),
+            _field_mapping("amounts.total", "Amount", required=True, formatter="currency"),
+            _field_mapping("amounts.tax", "Tax", formatter="currency"),
+            _field_mapping("payment.method", "Payment Method"),
+            _field_mapping("items", "Description", formatter="items_summary"),
+            _field_mapping("metadata.items_count", "Items Count"),
+            _field_mapping("confidence.validation_confidence", "Confidence", formatter="percentage")
+        ],
+        formatting=FormattingOptions(
+            date_format='%m/%d/%Y',
+            include_currency_in_totals=True,
+            show_confidence_scores=True
+        ),
+        sort_by="date",
+        export_formats=["xlsx", "csv"]
+    )
+    
+    # Business expense report template
+    templates["business_expenses"] = ExportTemplate(
+        name="Business Expense Report",
+        description="Template for business expense reporting",
+        template_type=TemplateType.BUSINESS,
+        fields=[
+            _field_mapping("transaction.date", "Date", required=True, formatter="date"),
+            _field_mapping("merchant.name", "Vendor", required=True),
+            _field_mapping("merchant.address", "Vendor Address"),
+            _field_mapping("amounts.subtotal", "Subtotal", formatter="currency"),
+            _field_mapping("amounts.tax", "Tax Amount", formatter="currency"),
+            _field_mapping("amounts.total", "Total", required=True, formatter="currency"),
+            _field_mapping("payment.method", "Payment Method"),
+            _field_mapping("transaction.receipt_number", "Receipt Number"),
+            _field_mapping("items", "Business Purpose", formatter="items_business"),
+            _field_mapping("validation.is_valid", "Valid Receipt", formatter="boolean")
+        ],
+        formatting=FormattingOptions(
+            date_format='%Y-%m-%d',
+            include_currency_in_totals=True,
+            show_confidence_scores=False,
+            show_validation_details=True
+        ),
+        include_summary=True,
+        group_by="merchant",
+        export_formats=["xlsx", "csv", "json"],
+        business_fields={
+            "employee_name": "",
+            "department": "",
+            "project_code": "",
+            "approval_status": "Pending"
+        }
+    )
+    
+    # Tax preparation template
+    templates["tax_preparation"] = ExportTemplate(
+        name="Tax Preparation",
+        description="Template optimized for tax preparation",
+        template_type=TemplateType.TAX_PREPARATION,
+        fields=[
+            _field_mapping("transaction.date", "Date", required=True, formatter="date"),
+            _field_mapping("merchant.name", "Payee", required=True),
+            _field_mapping("amounts.total", "Amount", required=True, formatter="currency"),
+            _field_mapping("amounts.tax", "Sales Tax", formatter="currency"),
+            _field_mapping("payment.method", "Payment Type"),
+            _field_mapping("items", "Expense Category", formatter="tax_category"),
+            _field_mapping("merchant.address", "Location"),
+            _field_mapping("validation.is_valid", "Verified", formatter="boolean")
+        ],
+        formatting=FormattingOptions(
+            date_format='%m/%d/%Y',
+            include_currency_in_totals=True,
+            show_confidence_scores=False,
+            show_validation_details=True
+        ),
+        group_by="date",
+        sort_by="date",
+        export_formats=["xlsx", "csv"],
+        custom_calculations=[
+            {
+                "name": "quarterly_total",
+                "description": "Quarterly spending total",
+                "formula": "sum_by_quarter(amounts.total)"
+            },
+            {
+                "name": "deductible_amount",
+                "description": "Potentially deductible amount",
+                "formula": "sum_business_expenses()"
+            }
+        ]
+    )
+    
+    # Accounting template
+    templates["accounting"] = ExportTemplate(
+        name="Accounting Integration",
+        description="Template for accounting software integration",
+        template_type=TemplateType.ACCOUNTING,
+        fields=[
+            _field_mapping("transaction.date", "Transaction Date", required=True, formatter="date"),
+            _field_mapping("merchant.name", "Vendor Name", required=True),
+            _field_mapping("amounts.total", "Amount", required=True, formatter="currency"),
+            _field_mapping("amounts.tax", "Tax Amount", formatter="currency"),
+            _field_mapping("payment.method", "Payment Account"),
+            _field_mapping("items", "Account Code", formatter="accounting_code"),
+            _field_mapping("transaction.receipt_number", "Reference"),
+            _field_mapping("merchant.address", "Vendor Address"),
+            _field_mapping("file_info.file_name", "Source Document")
+        ],
+        formatting=FormattingOptions(
+            date_format='%Y-%m-%d',
+            include_currency_in_totals=False,  # Numbers only for accounting
+            show_confidence_scores=False,
+            decimal_places=2
+        ),
+        include_items_detail=True,
+        export_formats=["csv", "json"]
+    )
+    
+    # Detailed analysis template
+    templates["detailed_analysis"] = ExportTemplate(
+        name="Detailed Analysis",
+        description="Comprehensive template with all available data",
+        template_type=TemplateType.CUSTOM,
+        fields=[
+            _field_mapping("file_info.file_name", "Source File"),
+            _field_mapping("transaction.date", "Date", formatter="date"),
+            _field_mapping("transaction.time", "Time"),
+            _field_mapping("merchant.name", "Merchant"),
+            _field_mapping("merchant.address", "Address"),
+            _field_mapping("merchant.phone", "Phone", formatter="phone"),
+            _field_mapping("amounts.subtotal", "Subtotal", formatter="currency"),
+            _field_mapping("amounts.tax", "Tax", formatter="currency"),
+            _field_mapping("amounts.tip", "Tip", formatter="currency"),
+            _field_mapping("amounts.total", "Total", formatter="currency"),
+            _field_mapping("payment.method", "Payment Method"),
+            _field_mapping("payment.card_last_four", "Card Last 4"),
+            _field_mapping("transaction.receipt_number", "Receipt #"),
+            _field_mapping("metadata.items_count", "Items Count"),
+            _field_mapping("metadata.ocr_method", "OCR Method"),
+            _field_mapping("confidence.ocr_confidence", "OCR Confidence", formatter="percentage"),
+            _field_mapping("confidence.validation_confidence", "Validation Confidence", formatter="percentage"),
+            _field_mapping("validation.is_valid", "Valid", formatter="boolean")
+        ],
+        formatting=FormattingOptions(
+            show_confidence_scores=True,
+            show_validation_details=True,
+            show_processing_metadata=True
+        ),
+        include_summary=True,
+        include_items_detail=True,
+        export_formats=["xlsx", "json"]
+    )
+    
+    return templates
+
+
 class ExportTemplateManager:
     """Manages export templates and configurations."""
     
+    # Upper bound on threads reading custom template files at once
+    LOAD_WORKERS = 8
+    
     def __init__(self, templates_dir: str = "config/templates"):
         """
         Initialize template manager.
@@ -77,198 +347,99 @@ class ExportTemplateManager:
         self.templates_dir.mkdir(parents=True, exist_ok=True)
         self.logger = logging.getLogger(__name__)
         
-        # Load built-in templates
-        self.templates = self._load_builtin_templates()
+        # Built-in templates, built per manager since ExportTemplate is mutable
+        self._templates = _build_builtin_templates()
         
-        # Load custom templates
-        self._load_custom_templates()
-    
-    def _load_builtin_templates(self) -> Dict[str, ExportTemplate]:
-        """Load built-in export templates."""
-        templates = {}
+        # Custom template files by stem, parsed on first use
+        self._pending_custom = self._scan_template_files()
         
-        # Personal expense tracking template
-        templates["personal_expenses"] = ExportTemplate(
-            name="Personal Expenses",
-            description="Template for personal expense tracking",
-            template_type=TemplateType.PERSONAL,
-            fields=[
-                FieldMapping("transaction.date", "Date", required=True, formatter="date"),
-                FieldMapping("merchant.name", "Merchant", required=True),
-                FieldMapping("amounts.total", "Amount", required=True, formatter="currency"),
-                FieldMapping("amounts.tax", "Tax", formatter="currency"),
-                FieldMapping("payment.method", "Payment Method"),
-                FieldMapping("items", "Description", formatter="items_summary"),
-                FieldMapping("metadata.items_count", "Items Count"),
-                FieldMapping("confidence.validation_confidence", "Confidence", formatter="percentage")
-            ],
-            formatting=FormattingOptions(
-                date_format='%m/%d/%Y',
-                include_currency_in_totals=True,
-                show_confidence_scores=True
-            ),
-            sort_by="date",
-            export_formats=["xlsx", "csv"]
-        )
+        # Resolved lookups by requested name; cleared whenever templates change
+        self._resolve_template = lru_cache(maxsize=32)(self._lookup_template)
         
-        # Business expense report template
-        templates["business_expenses"] = ExportTemplate(
-            name="Business Expense Report",
-            description="Template for business expense reporting",
-            template_type=TemplateType.BUSINESS,
-            fields=[
-                FieldMapping("transaction.date", "Date", required=True, formatter="date"),
-                FieldMapping("merchant.name", "Vendor", required=True),
-                FieldMapping("merchant.address", "Vendor Address"),
-                FieldMapping("amounts.subtotal", "Subtotal", formatter="currency"),
-                FieldMapping("amounts.tax", "Tax Amount", formatter="currency"),
-                FieldMapping("amounts.total", "Total", required=True, formatter="currency"),
-                FieldMapping("payment.method", "Payment Method"),
-                FieldMapping("transaction.receipt_number", "Receipt Number"),
-                FieldMapping("items", "Business Purpose", formatter="items_business"),
-                FieldMapping("validation.is_valid", "Valid Receipt", formatter="boolean")
-            ],
-            formatting=FormattingOptions(
-                date_format='%Y-%m-%d',
-                include_currency_in_totals=True,
-                show_confidence_scores=False,
-                show_validation_details=True
-            ),
-            include_summary=True,
-            group_by="merchant",
-            export_formats=["xlsx", "csv", "json"],
-            business_fields={
-                "employee_name": "",
-                "department": "",
-                "project_code": "",
-                "approval_status": "Pending"
-            }
-        )
+        # list_templates() entries, built once until a template is added
+        self._template_list: Optional[Tuple[Dict[str, str], ...]] = None
+    
+    @property
+    def templates(self) -> Dict[str, ExportTemplate]:
+        """All templates by key, loading any custom templates not loaded yet."""
+        if self._pending_custom:
+            self._load_custom_templates()
+        return self._templates
+    
+    def _scan_template_files(self) -> Dict[str, Path]:
+        """
+        List the custom template files with a single directory scan.
         
-        # Tax preparation template
-        templates["tax_preparation"] = ExportTemplate(
-            name="Tax Preparation",
-            description="Template optimized for tax preparation",
-            template_type=TemplateType.TAX_PREPARATION,
-            fields=[
-                FieldMapping("transaction.date", "Date", required=True, formatter="date"),
-                FieldMapping("merchant.name", "Payee", required=True),
-                FieldMapping("amounts.total", "Amount", required=True, formatter="currency"),
-                FieldMapping("amounts.tax", "Sales Tax", formatter="currency"),
-                FieldMapping("payment.method", "Payment Type"),
-                FieldMapping("items", "Expense Category", formatter="tax_category"),
-                FieldMapping("merchant.address", "Location"),
-                FieldMapping("validation.is_valid", "Verified", formatter="boolean")
-            ],
-            formatting=FormattingOptions(
-                date_format='%m/%d/%Y',
-                include_currency_in_totals=True,
-                show_confidence_scores=False,
-                show_validation_details=True
-            ),
-            group_by="date",
-            sort_by="date",
-            export_formats=["xlsx", "csv"],
-            custom_calculations=[
-                {
-                    "name": "quarterly_total",
-                    "description": "Quarterly spending total",
-                    "formula": "sum_by_quarter(amounts.total)"
-                },
-                {
-                    "name": "deductible_amount",
-                    "description": "Potentially deductible amount",
-                    "formula": "sum_business_expenses()"
+        Returns:
+            Dict mapping file stem to template file path
+        """
+        try:
+            with os.scandir(self.templates_dir) as entries:
+                return {
+                    entry.name[:-len(".json")]: Path(entry.path) for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
                 }
-            ]
-        )
-        
-        # Accounting template
-        templates["accounting"] = ExportTemplate(
-            name="Accounting Integration",
-            description="Template for accounting software integration",
-            template_type=TemplateType.ACCOUNTING,
-            fields=[
-                FieldMapping("transaction.date", "Transaction Date", required=True, formatter="date"),
-                FieldMapping("merchant.name", "Vendor Name", required=True),
-                FieldMapping("amounts.total", "Amount", required=True, formatter="currency"),
-                FieldMapping("amounts.tax", "Tax Amount", formatter="currency"),
-                FieldMapping("payment.method", "Payment Account"),
-                FieldMapping("items", "Account Code", formatter="accounting_code"),
-                FieldMapping("transaction.receipt_number", "Reference"),
-                FieldMapping("merchant.address", "Vendor Address"),
-                FieldMapping("file_info.file_name", "Source Document")
-            ],
-            formatting=FormattingOptions(
-                date_format='%Y-%m-%d',
-                include_currency_in_totals=False,  # Numbers only for accounting
-                show_confidence_scores=False,
-                decimal_places=2
-            ),
-            include_items_detail=True,
-            export_formats=["csv", "json"]
-        )
-        
-        # Detailed analysis template
-        templates["detailed_analysis"] = ExportTemplate(
-            name="Detailed Analysis",
-            description="Comprehensive template with all available data",
-            template_type=TemplateType.CUSTOM,
-            fields=[
-                FieldMapping("file_info.file_name", "Source File"),
-                FieldMapping("transaction.date", "Date", formatter="date"),
-                FieldMapping("transaction.time", "Time"),
-                FieldMapping("merchant.name", "Merchant"),
-                FieldMapping("merchant.address", "Address"),
-                FieldMapping("merchant.phone", "Phone", formatter="phone"),
-                FieldMapping("amounts.subtotal", "Subtotal", formatter="currency"),
-                FieldMapping("amounts.tax", "Tax", formatter="currency"),
-                FieldMapping("amounts.tip", "Tip", formatter="currency"),
-                FieldMapping("amounts.total", "Total", formatter="currency"),
-                FieldMapping("payment.method", "Payment Method"),
-                FieldMapping("payment.card_last_four", "Card Last 4"),
-                FieldMapping("transaction.receipt_number", "Receipt #"),
-                FieldMapping("metadata.items_count", "Items Count"),
-                FieldMapping("metadata.ocr_method", "OCR Method"),
-                FieldMapping("confidence.ocr_confidence", "OCR Confidence", formatter="percentage"),
-                FieldMapping("confidence.validation_confidence", "Validation Confidence", formatter="percentage"),
-                FieldMapping("validation.is_valid", "Valid", formatter="boolean")
-            ],
-            formatting=FormattingOptions(
-                show_confidence_scores=True,
-                show_validation_details=True,
-                show_processing_metadata=True
-            ),
-            include_summary=True,
-            include_items_detail=True,
-            export_formats=["xlsx", "json"]
-        )
-        
-        return templates
+        except OSError as e:
+            self.logger.warning(f"Failed to scan templates directory {self.templates_dir}: {str(e)}")
+            return {}
     
     def _load_custom_templates(self):
-        """Load custom templates from files."""
-        template_files = self.templates_dir.glob("*.json")
+        """Load custom templates from files not loaded yet, reading them in parallel."""
+        template_files = list(self._pending_custom.values())
+        self._pending_custom.clear()
         
-        for template_file in template_files:
-            try:
-                with open(template_file, 'r', encoding='utf-8') as f:
-                    template_data = json.load(f)
-                
-                template = self._dict_to_template(template_data)
-                self.templates[template.name.lower().replace(" ", "_")] = template
-                
-                self.logger.info(f"Loaded custom template: {template.name}")
-                
-            except Exception as e:
-                self.logger.warning(f"Failed to load template {template_file}: {str(e)}")
+        if template_files:
+            with ThreadPoolExecutor(max_workers=min(self.LOAD_WORKERS, len(template_files))) as executor:
+                # Register in scan order so duplicate names resolve as before
+                for template in executor.map(self._read_custom_template, template_files):
+                    if template is not None:
+                        self._register_custom_template(template)
+        self._resolve_template.cache_clear()
+    
+    def _load_custom_template(self, template_file: Path):
+        """Load one custom template file into the registry."""
+        template = self._read_custom_template(template_file)
+        if template is not None:
+            self._register_custom_template(template)
+    
+    def _read_custom_template(self, template_file: Path) -> Optional[ExportTemplate]:
+        """Read a custom template file, logging and returning None on failure."""
+        try:
+            return self._load_template_file(template_file)
+        except Exception as e:
+            self.logger.warning(f"Failed to load template {template_file}: {str(e)}")
+            return None
+    
+    def _register_custom_template(self, template: ExportTemplate):
+        """Add a loaded custom template to the registry."""
+        self._templates[_template_key(template.name)] = template
+        self._template_list = None
+        self.logger.info(f"Loaded custom template: {template.name}")
+    
+    def _load_template_file(self, template_file: Path) -> ExportTemplate:
+        """
+        Load a custom template from its JSON file.
+        
+        Args:
+            template_file: Path to the template JSON file
+            
+        Returns:
+            The parsed template
+        """
+        with open(template_file, 'rb') as f:
+            return self._dict_to_template(orjson.loads(f.read()))
     
     def _dict_to_template(self, data: Dict[str, Any]) -> ExportTemplate:
-        """Convert dictionary to ExportTemplate object."""
+        """
+        Convert dictionary to ExportTemplate object.
+        
+        The dictionary is reused as the constructor kwargs, so callers pass
+        one they own (e.g. freshly parsed JSON).
+        """
         # Convert fields
         fields = []
         for field_data in data.get('fields', []):
-            field = FieldMapping(**field_data)
+            field = _field_mapping(**field_data)
             fields.append(field)
         
         # Convert formatting options
@@ -276,50 +447,70 @@ class ExportTemplateManager:
         formatting = FormattingOptions(**formatting_data)
         
         # Convert template type
-        template_type = TemplateType(data.get('template_type', 'custom'))
+        template_type = _to_template_type(data.get('template_type', 'custom'))
         
         # Create template
-        template_data = data.copy()
-        template_data['fields'] = fields
-        template_data['formatting'] = formatting
-        template_data['template_type'] = template_type
+        data['fields'] = fields
+        data['formatting'] = formatting
+        data['template_type'] = template_type
         
-        return ExportTemplate(**template_data)
+        return ExportTemplate(**data)
     
     def get_template(self, template_name: str) -> Optional[ExportTemplate]:
         """Get template by name."""
-        return self.templates.get(template_name.lower().replace(" ", "_"))
+        return self._resolve_template(template_name)
+    
+    def _lookup_template(self, template_name: str) -> Optional[ExportTemplate]:
+        """Find a template by name, loading only its own file if it is a custom one."""
+        template_key = _template_key(template_name)
+        template_file = self._pending_custom.pop(template_key, None)
+        if template_file is not None:
+            self._load_custom_template(template_file)
+        
+        template = self._templates.get(template_key)
+        if template is None and self._pending_custom:
+            # A hand-written file may hold the template under a different stem
+            template = self.templates.get(template_key)
+        return template
     
     def list_templates(self) -> List[Dict[str, str]]:
-        """List available templates."""
-        return [
-            {
-                "name": template.name,
-                "key": key,
-                "description": template.description,
-                "type": template.template_type.value,
-                "formats": ", ".join(template.export_formats)
-            }
-            for key, template in self.templates.items()
-        ]
+        """List available templates (entries are shared between calls; don't modify them)."""
+        templates = self.templates
+        if self._template_list is None:
+            self._template_list = tuple(
+                {
+                    "name": template.name,
+                    "key": key,
+                    "description": template.description,
+                    "type": template.template_type.value,
+                    "formats": ", ".join(template.export_formats)
+                }
+                for key, template in templates.items()
+            )
+        return list(self._template_list)
     
     def save_custom_template(self, template: ExportTemplate) -> bool:
         """Save a custom template to file."""
         try:
-            template_file = self.templates_dir / f"{template.name.lower().replace(' ', '_')}.json"
-            
-            # Convert to dictionary
-            template_dict = asdict(template)
+            template_key = _template_key(template.name)
+            template_file = self.templates_dir / f"{template_key}.json"
             
-            # Convert enum to string
-            template_dict['template_type'] = template.template_type.value
-            
-            # Save to file
-            with open(template_file, 'w', encoding='utf-8') as f:
-                json.dump(template_dict, f, indent=2, ensure_ascii=False)
+            # Write a temporary file and swap it in, so a failed save never
+            # leaves a truncated template behind
+            payload = orjson.dumps(_template_to_dict(template), option=orjson.OPT_INDENT_2)
+            temp_file = template_file.with_name(template_file.name + '.tmp')
+            try:
+                write_bytes(temp_file, payload)
+                os.replace(temp_file, template_file)
+            except BaseException:
+                temp_file.unlink(missing_ok=True)
+                raise
             
             # Add to loaded templates
-            self.templates[template.name.lower().replace(" ", "_")] = template
+            self._pending_custom.pop(template_key, None)
+            self._templates[template_key] = template
+            self._resolve_template.cache_clear()
+            self._template_list = None
             
             self.logger.info(f"Saved custom template: {template.name}")
             return True
@@ -336,7 +527,7 @@ class ExportTemplateManager:
         # Convert field configurations
         fields = []
         for field_config_item in field_config:
-            field = FieldMapping(**field_config_item)
+            field = _field_mapping(**field_config_item)
             fields.append(field)
         
         # Create formatting options
@@ -353,45 +544,9 @@ class ExportTemplateManager:
         
         return template
     
-    def get_field_suggestions(self) -> Dict[str, List[str]]:
-        """Get suggestions for field mappings."""
-        return {
-            "merchant": [
-                "merchant.name",
-                "merchant.address", 
-                "merchant.phone"
-            ],
-            "transaction": [
-                "transaction.date",
-                "transaction.time",
-                "transaction.receipt_number"
-            ],
-            "amounts": [
-                "amounts.subtotal",
-                "amounts.tax",
-                "amounts.tip",
-                "amounts.total"
-            ],
-            "payment": [
-                "payment.method",
-                "payment.card_last_four"
-            ],
-            "items": [
-                "items",
-                "metadata.items_count"
-            ],
-            "quality": [
-                "confidence.ocr_confidence",
-                "confidence.validation_confidence",
-                "validation.is_valid"
-            ],
-            "metadata": [
-                "file_info.file_name",
-                "file_info.file_id",
-                "metadata.ocr_method",
-                "metadata.processing_time"
-            ]
-        }
+    def get_field_suggestions(self) -> Mapping[str, Tuple[str, ...]]:
+        """Get suggestions for field mappings (a shared, read-only mapping)."""
+        return _FIELD_SUGGESTIONS
     
     def validate_template(self, template: ExportTemplate) -> Dict[str, Any]:
         """Validate template configuration."""
@@ -408,19 +563,29 @@ class ExportTemplateManager:
         if not template.fields:
             validation_result["errors"].append("At least one field mapping is required")
         
-        # Check field mappings
+        # Check field mappings in one pass, also catching export names used
+        # twice (later columns would overwrite earlier ones in the export)
+        seen_names = set()
+        duplicate_names = {}
         for field in template.fields:
             if not field.source_field:
                 validation_result["errors"].append(f"Source field is required for '{field.export_name}'")
             
             if not field.export_name:
                 validation_result["errors"].append(f"Export name is required for field '{field.source_field}'")
+            elif field.export_name in seen_names:
+                duplicate_names[field.export_name] = None
+            else:
+                seen_names.add(field.export_name)
+        
+        validation_result["warnings"].extend(f"Duplicate export name: {name}" for name in duplicate_names)
         
-        # Check export formats
-        valid_formats = {"csv", "xlsx", "json"}
-        for fmt in template.export_formats:
-            if fmt not in valid_formats:
-                validation_result["warnings"].append(f"Unknown export format: {fmt}")
+        # Check export formats, reporting each unknown one once in listed order
+        if not _VALID_EXPORT_FORMATS.issuperset(template.export_formats):
+            validation_result["warnings"].extend(
+                f"Unknown export format: {fmt}"
+                for fmt in dict.fromkeys(template.export_formats) if fmt not in _VALID_EXPORT_FORMATS
+            )
         
         # Set overall validity
         validation_result["is_valid"] = len(validation_result["errors"]) == 0
@@ -1,4 +1,3 @@
-import json
 import csv
 import logging
 from pathlib import Path
@@ -6,14 +5,17 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 from decimal import Decimal
 
+import orjson
 import pandas as pd
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.chart import BarChart, PieChart, Reference
 
 from ..processing.data_extractor import ReceiptData, ReceiptItem
 from ..utils.config import ExportConfig
+from ..utils.fileio import json_dump_options, write_bytes
 
 
 class SpreadsheetExporter:
@@ -29,6 +31,8 @@ class SpreadsheetExporter:
         self.config = config
         self.logger = logging.getLogger(__name__)
         
+        self._json_options = json_dump_options(config.pretty_json)
+        
         # Create output directory
         self.output_dir = Path(config.output_directory)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -296,14 +300,9 @@ class SpreadsheetExporter:
         if self.config.include_confidence_scores:
             headers.extend(['Validation Details', 'Is Valid'])
         
-        # Write headers
-        for col_idx, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color='CCCCCC', end_color='CCCCCC', fill_type='solid')
-        
-        # Write data
-        for row_idx, receipt in enumerate(receipts, start=2):
+        # Build data rows
+        rows = []
+        for receipt in receipts:
             rd = receipt['receipt_data']
             
             row_data = [
@@ -330,21 +329,9 @@ class SpreadsheetExporter:
                     'Yes' if validation.get('is_valid', False) else 'No'
                 ])
             
-            for col_idx, value in enumerate(row_data, start=1):
-                ws.cell(row=row_idx, column=col_idx, value=value)
+            rows.append(row_data)
         
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column = [cell for cell in column]
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min((max_length + 2), 50)  # Cap at 50
-            ws.column_dimensions[column[0].column_letter].width = adjusted_width
+        self._write_table(ws, headers, rows)
     
     def _create_items_sheet(self, ws, receipts: List[Dict[str, Any]]):
         """Create line items worksheet."""
@@ -354,14 +341,8 @@ class SpreadsheetExporter:
             'Unit Price', 'Total Price', 'Item Confidence'
         ]
         
-        # Write headers
-        for col_idx, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color='CCCCCC', end_color='CCCCCC', fill_type='solid')
-        
-        # Write data
-        row_idx = 2
+        # Build data rows
+        rows = []
         for receipt in receipts:
             rd = receipt['receipt_data']
             items = rd.get('items', [])
@@ -375,10 +356,7 @@ class SpreadsheetExporter:
                     '(No items detected)',
                     '', '', '', ''
                 ]
-                
-                for col_idx, value in enumerate(row_data, start=1):
-                    ws.cell(row=row_idx, column=col_idx, value=value)
-                row_idx += 1
+                rows.append(row_data)
             else:
                 for item in items:
                     row_data = [
@@ -391,23 +369,36 @@ class SpreadsheetExporter:
                         item.get('total_price', ''),
                         f"{item.get('confidence', 0):.1%}" if item.get('confidence') else ''
                     ]
-                    
-                    for col_idx, value in enumerate(row_data, start=1):
-                        ws.cell(row=row_idx, column=col_idx, value=value)
-                    row_idx += 1
+                    rows.append(row_data)
         
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column = [cell for cell in column]
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min((max_length + 2), 50)  # Cap at 50
-            ws.column_dimensions[column[0].column_letter].width = adjusted_width
+        self._write_table(ws, headers, rows)
+    
+    def _write_table(self, ws, headers: List[str], rows: List[List[Any]], max_width: int = 50):
+        """
+        Write a styled header row and data rows, then size columns to fit.
+        
+        Whole rows are appended instead of writing cell by cell, and column
+        widths are tracked while writing rather than by rescanning the sheet.
+        
+        Args:
+            ws: Worksheet to write to
+            headers: Column headers
+            rows: Data rows, one list of values per row
+            max_width: Maximum column width
+        """
+        ws.append(headers)
+        for cell in ws[1]:
+            cell.font = Font(bold=True)
+            cell.fill = PatternFill(start_color='CCCCCC', end_color='CCCCCC', fill_type='solid')
+        
+        widths = [len(str(header)) for header in headers]
+        for row_data in rows:
+            ws.append(row_data)
+            for col_idx, value in enumerate(row_data):
+                widths[col_idx] = max(widths[col_idx], len(str(value)))
+        
+        for col_idx, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(width + 2, max_width)
     
     def _add_charts_to_summary(self, ws, receipts: List[Dict[str, Any]]):
         """Add charts to summary sheet."""
@@ -482,8 +473,7 @@ class SpreadsheetExporter:
             export_data['receipts'].append(receipt_export)
         
         # Write JSON
-        with open(json_path, 'w', encoding='utf-8') as jsonfile:
-            json.dump(export_data, jsonfile, indent=2, ensure_ascii=False, default=str)
+        write_bytes(json_path, orjson.dumps(export_data, option=self._json_options, default=str))
         
         self.logger.info(f"JSON exported to: {json_path}")
         return str(json_path)
@@ -133,6 +133,18 @@ class ReceiptDataExtractor:
             re.compile(r'#([a-z0-9]{4,})', re.IGNORECASE),
         ]
         
+        # Address line indicators
+        self.address_patterns = [
+            re.compile(r'\d+\s+\w+\s+(st|street|ave|avenue|rd|road|blvd|boulevard|dr|drive|ln|lane|ct|court)', re.IGNORECASE),
+            re.compile(r'\w+,\s*[A-Z]{2}\s*\d{5}', re.IGNORECASE),  # City, State ZIP
+            re.compile(r'\d{3,5}\s+\w+', re.IGNORECASE),  # Street number + name
+        ]
+        
+        # Text cleanup patterns
+        self.whitespace_pattern = re.compile(r'\s+')
+        self.currency_symbol_pattern = re.compile(r'[$＄]')
+        self.non_printable_pattern = re.compile(r'[^\x20-\x7E\n]')
+        
         # Payment method patterns
         self.payment_patterns = [
             re.compile(r'(?:visa|mastercard|amex|american express|discover|cash|credit|debit)(?:\s+ending\s+in\s+(\d{4}))?', re.IGNORECASE),
@@ -198,13 +210,13 @@ class ReceiptDataExtractor:
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text for better parsing."""
         # Remove extra whitespace
-        cleaned = re.sub(r'\s+', ' ', text)
+        cleaned = self.whitespace_pattern.sub(' ', text)
         
         # Normalize currency symbols
-        cleaned = re.sub(r'[$＄]', '$', cleaned)
+        cleaned = self.currency_symbol_pattern.sub('$', cleaned)
         
         # Remove non-printable characters except newlines
-        cleaned = re.sub(r'[^\x20-\x7E\n]', '', cleaned)
+        cleaned = self.non_printable_pattern.sub('', cleaned)
         
         return cleaned.strip()
     
@@ -230,16 +242,7 @@ class ReceiptDataExtractor:
     
     def _is_address_line(self, line: str) -> bool:
         """Check if line looks like an address."""
-        address_indicators = [
-            r'\d+\s+\w+\s+(st|street|ave|avenue|rd|road|blvd|boulevard|dr|drive|ln|lane|ct|court)',
-            r'\w+,\s*[A-Z]{2}\s*\d{5}',  # City, State ZIP
-            r'\d{3,5}\s+\w+',  # Street number + name
-        ]
-        
-        for pattern in address_indicators:
-            if re.search(pattern, line, re.IGNORECASE):
-                return True
-        return False
+        return any(pattern.search(line) for pattern in self.address_patterns)
     
     def _is_phone_line(self, line: str) -> bool:
         """Check if line contains a phone number."""
@@ -3,7 +3,6 @@ import numpy as np
 import logging
 from pathlib import Path
 from typing import Tuple, Optional, Dict, Any
-from PIL import Image, ImageEnhance, ImageFilter
 
 
 class ImagePreprocessor:
@@ -31,8 +30,8 @@ class ImagePreprocessor:
             Path to preprocessed image
         """
         try:
-            # Load image
-            image = cv2.imread(str(image_path))
+            # Load directly as grayscale; the pipeline is single-channel throughout
+            image = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
             if image is None:
                 raise ValueError(f"Could not load image: {image_path}")
             
@@ -57,13 +56,13 @@ class ImagePreprocessor:
         Apply the complete preprocessing pipeline.
         
         Args:
-            image: Input image array
+            image: Input image array (grayscale or BGR)
             
         Returns:
-            Processed image array
+            Processed grayscale image array
         """
-        # 1. Resize if too large
-        processed = self._resize_image(image)
+        # 1. Resize if too large (before any per-pixel work)
+        processed = self._to_grayscale(self._resize_image(image))
         
         # 2. Noise reduction
         processed = self._reduce_noise(processed)
@@ -99,36 +98,28 @@ class ImagePreprocessor:
         
         return resized
     
+    def _to_grayscale(self, image: np.ndarray) -> np.ndarray:
+        """Convert a BGR image to grayscale; grayscale input is returned as-is."""
+        if image.ndim == 2:
+            return image
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    
     def _reduce_noise(self, image: np.ndarray) -> np.ndarray:
         """Apply noise reduction techniques."""
-        # Convert to grayscale for noise reduction
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
         # Apply Non-local Means Denoising
-        denoised = cv2.fastNlMeansDenoising(gray)
-        
-        # Convert back to BGR
-        return cv2.cvtColor(denoised, cv2.COLOR_GRAY2BGR)
+        return cv2.fastNlMeansDenoising(self._to_grayscale(image))
     
     def _enhance_contrast(self, image: np.ndarray) -> np.ndarray:
         """Enhance image contrast using CLAHE."""
-        # Convert to LAB color space
-        lab = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
-        
-        # Apply CLAHE to L channel
+        # On a grayscale image CLAHE applies directly to the luminance,
+        # which avoids the round trip through LAB color space
         clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
-        lab[:, :, 0] = clahe.apply(lab[:, :, 0])
-        
-        # Convert back to BGR
-        enhanced = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
-        
-        return enhanced
+        return clahe.apply(self._to_grayscale(image))
     
     def _deskew_image(self, image: np.ndarray) -> np.ndarray:
         """Detect and correct image skew."""
         try:
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            gray = self._to_grayscale(image)
             
             # Edge detection
             edges = cv2.Canny(gray, 50, 150, apertureSize=3)
@@ -139,22 +130,16 @@ class ImagePreprocessor:
             if lines is None:
                 return image
             
-            # Calculate skew angle
-            angles = []
-            for line in lines:
-                rho, theta = line[0]
-                angle = theta * 180 / np.pi
-                # Normalize angle to [-45, 45] degrees
-                if angle > 45:
-                    angle = angle - 90
-                if abs(angle) < 45:  # Only consider reasonable skew angles
-                    angles.append(angle)
-            
-            if not angles:
+            # Calculate skew angles, normalized to [-45, 45] degrees
+            angles = np.degrees(lines[:, 0, 1])
+            angles = np.where(angles > 45, angles - 90, angles)
+            angles = angles[np.abs(angles) < 45]  # Only consider reasonable skew angles
+            
+            if angles.size == 0:
                 return image
             
             # Use median angle to avoid outliers
-            skew_angle = np.median(angles)
+            skew_angle = float(np.median(angles))
             
             # Only deskew if angle is significant
             if abs(skew_angle) > 0.5:
@@ -200,14 +185,11 @@ class ImagePreprocessor:
             Path to preprocessed image
         """
         try:
-            # Load image
-            image = cv2.imread(str(image_path))
-            if image is None:
+            # Load image as grayscale
+            gray = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+            if gray is None:
                 raise ValueError(f"Could not load image: {image_path}")
             
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
             # Apply bilateral filter to reduce noise while keeping edges sharp
             filtered = cv2.bilateralFilter(gray, 9, 75, 75)
             
@@ -240,27 +222,24 @@ class ImagePreprocessor:
             Path to enhanced image
         """
         try:
-            # Use PIL for some enhancements
-            pil_image = Image.open(image_path)
-            
-            # Convert to grayscale if not already
-            if pil_image.mode != 'L':
-                pil_image = pil_image.convert('L')
-            
-            # Enhance contrast
-            enhancer = ImageEnhance.Contrast(pil_image)
-            enhanced = enhancer.enhance(1.5)
+            # Load image as grayscale
+            gray = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+            if gray is None:
+                raise ValueError(f"Could not load image: {image_path}")
             
-            # Enhance sharpness
-            enhancer = ImageEnhance.Sharpness(enhanced)
-            enhanced = enhancer.enhance(2.0)
+            # Enhance contrast around the mean intensity; addWeighted saturates
+            # to 0..255, so dark text strokes clamp to black instead of folding
+            # back to grey as convertScaleAbs's absolute value would
+            mean = float(np.mean(gray))
+            enhanced = cv2.addWeighted(gray, 1.5, gray, 0, -0.5 * mean)
             
-            # Apply unsharp mask
-            enhanced = enhanced.filter(ImageFilter.UnsharpMask(radius=2, percent=150, threshold=3))
+            # Apply unsharp mask for text clarity
+            blurred = cv2.GaussianBlur(enhanced, (0, 0), 2)
+            enhanced = cv2.addWeighted(enhanced, 2.5, blurred, -1.5, 0)
             
             # Save enhanced image
             output_path = image_path.parent / f"ocr_enhanced_{image_path.name}"
-            enhanced.save(output_path)
+            cv2.imwrite(str(output_path), enhanced)
             
             return output_path
             
@@ -279,12 +258,10 @@ class ImagePreprocessor:
             Dict with quality metrics
         """
         try:
-            image = cv2.imread(str(image_path))
-            if image is None:
+            gray = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+            if gray is None:
                 return {'error': 'Could not load image'}
             
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
             # Calculate sharpness (Laplacian variance)
             laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
             
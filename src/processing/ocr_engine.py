@@ -1,6 +1,7 @@
 import os
 import logging
 import tempfile
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import pytesseract
@@ -35,6 +36,10 @@ class OCREngine:
         
         # Check Tesseract availability
         self.tesseract_available = self._check_tesseract()
+        
+        # Tiered OCR outcomes; engine calls may run on several threads
+        self._tier_lock = threading.Lock()
+        self.tier_stats = {'tier1_hits': 0, 'tier2_upgrades': 0}
     
     def _check_tesseract(self) -> bool:
         """Check if Tesseract is available."""
@@ -127,6 +132,13 @@ class OCREngine:
         import time
         start_time = time.time()
         
+        # Cheap first pass; only low-confidence images go on to the Vision API
+        if self.config.tier1_threshold is not None and self.tesseract_available:
+            tier1_result = self._tier1_ocr(image_path)
+            if tier1_result:
+                tier1_result['processing_time'] = time.time() - start_time
+                return tier1_result
+        
         # Try Google Vision API first
         if self.vision_service.is_available():
             try:
@@ -198,6 +210,55 @@ class OCREngine:
             'error': 'All OCR methods failed'
         }
     
+    def _tier1_ocr(self, image_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Run Tesseract on a downscaled copy of the image.
+        
+        Args:
+            image_path: Path to image
+            
+        Returns:
+            Dict with OCR results if confident enough, otherwise None
+        """
+        tesseract_result = None
+        try:
+            with Image.open(image_path) as image:
+                image.thumbnail((self.config.tier1_max_size, self.config.tier1_max_size))
+                tesseract_result = self._tesseract_ocr_image(image)
+        except Exception as e:
+            self.logger.warning(f"Tier 1 Tesseract OCR failed: {str(e)}")
+        
+        confidence = tesseract_result['confidence'] if tesseract_result else 0.0
+        accepted = tesseract_result is not None and confidence >= self.config.tier1_threshold
+        self._record_tier_outcome(accepted)
+        
+        if not accepted:
+            self.logger.debug(f"Tier 1 confidence too low ({confidence:.2f}), upgrading to full OCR")
+            return None
+        
+        return {
+            'success': True,
+            'method': 'tesseract_fast',
+            'text': tesseract_result['text'],
+            'confidence': confidence
+        }
+    
+    def _record_tier_outcome(self, accepted: bool) -> None:
+        """Count a tier 1 hit or upgrade and log the running upgrade ratio."""
+        with self._tier_lock:
+            self.tier_stats['tier1_hits' if accepted else 'tier2_upgrades'] += 1
+            total = self.tier_stats['tier1_hits'] + self.tier_stats['tier2_upgrades']
+            upgrade_ratio = self.tier_stats['tier2_upgrades'] / total
+        self.logger.debug(f"OCR tier upgrade ratio: {upgrade_ratio:.1%} of {total} images")
+    
+    def get_tier_stats(self) -> Dict[str, Any]:
+        """Get tiered OCR hit and upgrade counts."""
+        with self._tier_lock:
+            stats = dict(self.tier_stats)
+        total = stats['tier1_hits'] + stats['tier2_upgrades']
+        stats['upgrade_ratio'] = stats['tier2_upgrades'] / total if total else 0.0
+        return stats
+    
     def _tesseract_ocr(self, image_path: Path) -> Dict[str, Any]:
         """
         Perform OCR using Tesseract.
@@ -205,6 +266,19 @@ class OCREngine:
         Args:
             image_path: Path to image
             
+        Returns:
+            Dict with Tesseract OCR results
+        """
+        with Image.open(image_path) as image:
+            return self._tesseract_ocr_image(image)
+    
+    def _tesseract_ocr_image(self, image: Image.Image) -> Dict[str, Any]:
+        """
+        Perform OCR on an already loaded image using Tesseract.
+        
+        Args:
+            image: PIL image
+            
         Returns:
             Dict with Tesseract OCR results
         """
@@ -212,9 +286,6 @@ class OCREngine:
             # Configure Tesseract for better receipt recognition
             custom_config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz.,/$:-% '
             
-            # Open image
-            image = Image.open(image_path)
-            
             # Extract text
             text = pytesseract.image_to_string(image, config=custom_config)
             
@@ -319,6 +390,7 @@ class OCREngine:
             'preprocessing_enabled': self.config.use_opencv_preprocessing,
             'fallback_enabled': self.config.fallback_to_tesseract,
             'confidence_threshold': self.config.confidence_threshold,
+            'tier1_threshold': self.config.tier1_threshold,
             'max_image_size': self.config.max_image_size,
             'supported_formats': self.config.supported_formats
         }
\ No newline at end of file
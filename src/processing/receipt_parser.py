@@ -15,12 +15,34 @@ class ReceiptParser:
         self.logger = logging.getLogger(__name__)
         self.merchant_templates = self._load_merchant_templates()
         self.common_items = self._load_common_items()
+        self._compile_patterns()
+    
+    def _compile_patterns(self):
+        """Compile item description filters once instead of per item."""
+        # Common non-item patterns
+        self.invalid_item_patterns = [
+            re.compile(r'^\d+$'),  # Just numbers
+            re.compile(r'^[A-Z]{1,2}$'),  # Single/double letters
+            re.compile(r'total'),
+            re.compile(r'subtotal'),
+            re.compile(r'tax'),
+            re.compile(r'cash'),
+            re.compile(r'change'),
+            re.compile(r'visa'),
+            re.compile(r'mastercard'),
+            re.compile(r'thank you'),
+            re.compile(r'receipt'),
+            re.compile(r'store.*\d+'),
+            re.compile(r'^\*+$'),  # Just asterisks
+            re.compile(r'^-+$'),  # Just dashes
+        ]
+        self.letter_pattern = re.compile(r'[a-zA-Z]')
     
     def _load_merchant_templates(self) -> Dict[str, Dict[str, Any]]:
         """Load merchant-specific parsing templates."""
         return {
             'walmart': {
-                'name_patterns': [r'walmart.*supercenter', r'walmart.*store'],
+                'name_patterns': [re.compile(r'walmart.*supercenter'), re.compile(r'walmart.*store')],
                 'item_patterns': [
                     re.compile(r'^([A-Z0-9\s]+)\s+(\d{12})\s*([TNX])\s*(\d+\.\d{2})$', re.MULTILINE),
                     re.compile(r'^([A-Z0-9\s]+)\s+(\d+\.\d{2})\s*([TNX])$', re.MULTILINE),
@@ -29,21 +51,27 @@ class ReceiptParser:
                 'tax_pattern': re.compile(r'tax\s*(\d+\.\d{2})', re.IGNORECASE),
             },
             'target': {
-                'name_patterns': [r'target', r'target.*store'],
+                'name_patterns': [re.compile(r'target'), re.compile(r'target.*store')],
                 'item_patterns': [
                     re.compile(r'^(.+?)\s+(\d{3}-\d{2}-\d{4})\s*(\d+\.\d{2})\s*([TNX])$', re.MULTILINE),
                 ],
                 'total_pattern': re.compile(r'total\s*(\d+\.\d{2})', re.IGNORECASE),
             },
             'costco': {
-                'name_patterns': [r'costco.*wholesale'],
+                'name_patterns': [re.compile(r'costco.*wholesale')],
                 'item_patterns': [
                     re.compile(r'^(\d+)\s+(.+?)\s+(\d+\.\d{2})$', re.MULTILINE),
                 ],
                 'total_pattern': re.compile(r'total\s*(\d+\.\d{2})', re.IGNORECASE),
             },
             'grocery': {
-                'name_patterns': [r'kroger', r'safeway', r'publix', r'whole foods', r'trader.*joe'],
+                'name_patterns': [
+                    re.compile(r'kroger'),
+                    re.compile(r'safeway'),
+                    re.compile(r'publix'),
+                    re.compile(r'whole foods'),
+                    re.compile(r'trader.*joe'),
+                ],
                 'item_patterns': [
                     re.compile(r'^(.+?)\s+(\d+\.\d{2})\s*([FT])$', re.MULTILINE),
                     re.compile(r'^(.+?)\s+(\d+\.\d{2})$', re.MULTILINE),
@@ -51,7 +79,13 @@ class ReceiptParser:
                 'total_pattern': re.compile(r'total\s*(\d+\.\d{2})', re.IGNORECASE),
             },
             'restaurant': {
-                'name_patterns': [r'mcdonald', r'burger.*king', r'subway', r'starbucks', r'pizza'],
+                'name_patterns': [
+                    re.compile(r'mcdonald'),
+                    re.compile(r'burger.*king'),
+                    re.compile(r'subway'),
+                    re.compile(r'starbucks'),
+                    re.compile(r'pizza'),
+                ],
                 'item_patterns': [
                     re.compile(r'^(\d+)\s*x\s*(.+?)\s+(\d+\.\d{2})$', re.MULTILINE),
                     re.compile(r'^(.+?)\s+(\d+\.\d{2})$', re.MULTILINE),
@@ -132,7 +166,7 @@ class ReceiptParser:
         
         for merchant_type, template in self.merchant_templates.items():
             for pattern in template['name_patterns']:
-                if re.search(pattern, text_lower):
+                if pattern.search(text_lower):
                     return merchant_type
         
         return None
@@ -318,36 +352,18 @@ class ReceiptParser:
     
     def _is_valid_item_description(self, description: str) -> bool:
         """Check if description looks like a valid item."""
-        # Filter out common non-item patterns
-        invalid_patterns = [
-            r'^\d+$',  # Just numbers
-            r'^[A-Z]{1,2}$',  # Single/double letters
-            r'total',
-            r'subtotal',
-            r'tax',
-            r'cash',
-            r'change',
-            r'visa',
-            r'mastercard',
-            r'thank you',
-            r'receipt',
-            r'store.*\d+',
-            r'^\*+$',  # Just asterisks
-            r'^-+$',  # Just dashes
-        ]
-        
         description_lower = description.lower()
         
-        for pattern in invalid_patterns:
-            if re.search(pattern, description_lower):
-                return False
+        # Filter out common non-item patterns
+        if any(pattern.search(description_lower) for pattern in self.invalid_item_patterns):
+            return False
         
         # Must have reasonable length
         if len(description) < 3 or len(description) > 50:
             return False
         
         # Should contain some letters
-        if not re.search(r'[a-zA-Z]', description):
+        if not self.letter_pattern.search(description):
             return False
         
         return True
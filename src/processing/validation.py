@@ -1,3 +1,4 @@
+import re
 import logging
 from typing import Dict, Any, List, Optional, Tuple
 from decimal import Decimal, InvalidOperation
@@ -18,6 +19,30 @@ class ReceiptValidator:
         """
         self.min_confidence_threshold = min_confidence_threshold
         self.logger = logging.getLogger(__name__)
+        self._compile_patterns()
+    
+    def _compile_patterns(self):
+        """Compile field format patterns once instead of per check."""
+        # Common OCR artifacts mistaken for merchant names
+        self.invalid_merchant_patterns = [
+            re.compile(r'^[0-9\*\-\+\=]+$'),  # Just numbers/symbols
+            re.compile(r'^[a-z]{1,2}$'),      # Too short
+            re.compile(r'^(total|subtotal|tax|cash)$'),  # Common receipt words
+            re.compile(r'^\*+$'),             # Just asterisks
+        ]
+        
+        self.time_patterns = [
+            re.compile(r'^\d{1,2}:\d{2}$'),           # HH:MM
+            re.compile(r'^\d{1,2}:\d{2}:\d{2}$'),     # HH:MM:SS
+            re.compile(r'^\d{1,2}:\d{2}\s*(am|pm)$'), # HH:MM AM/PM
+        ]
+        
+        self.phone_patterns = [
+            re.compile(r'^\d{3}-\d{3}-\d{4}$'),
+            re.compile(r'^\(\d{3}\)\s*\d{3}-\d{4}$'),
+            re.compile(r'^\d{3}\.\d{3}\.\d{4}$'),
+            re.compile(r'^\d{10}$'),
+        ]
     
     def validate_receipt(self, receipt: ReceiptData) -> Dict[str, Any]:
         """
@@ -298,17 +323,8 @@ class ReceiptValidator:
         name = name.strip().lower()
         
         # Filter out common OCR artifacts
-        invalid_patterns = [
-            r'^[0-9\*\-\+\=]+$',  # Just numbers/symbols
-            r'^[a-z]{1,2}$',      # Too short
-            r'^(total|subtotal|tax|cash)$',  # Common receipt words
-            r'^\*+$',             # Just asterisks
-        ]
-        
-        import re
-        for pattern in invalid_patterns:
-            if re.match(pattern, name):
-                return False
+        if any(pattern.match(name) for pattern in self.invalid_merchant_patterns):
+            return False
         
         return 3 <= len(name) <= 50
     
@@ -329,34 +345,12 @@ class ReceiptValidator:
     
     def _is_valid_time_format(self, time_str: str) -> bool:
         """Check if time format is valid."""
-        import re
-        time_patterns = [
-            r'^\d{1,2}:\d{2}$',           # HH:MM
-            r'^\d{1,2}:\d{2}:\d{2}$',     # HH:MM:SS
-            r'^\d{1,2}:\d{2}\s*(am|pm)$', # HH:MM AM/PM
-        ]
-        
-        for pattern in time_patterns:
-            if re.match(pattern, time_str.lower()):
-                return True
-        
-        return False
+        time_str = time_str.lower()
+        return any(pattern.match(time_str) for pattern in self.time_patterns)
     
     def _is_valid_phone_format(self, phone: str) -> bool:
         """Check if phone number format is valid."""
-        import re
-        phone_patterns = [
-            r'^\d{3}-\d{3}-\d{4}$',
-            r'^\(\d{3}\)\s*\d{3}-\d{4}$',
-            r'^\d{3}\.\d{3}\.\d{4}$',
-            r'^\d{10}$'
-        ]
-        
-        for pattern in phone_patterns:
-            if re.match(pattern, phone):
-                return True
-        
-        return False
+        return any(pattern.match(phone) for pattern in self.phone_patterns)
     
     def _is_reasonable_amount(self, amount: Decimal) -> bool:
         """Check if monetary amount is reasonable."""
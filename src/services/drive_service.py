@@ -1,6 +1,7 @@
 import io
 import logging
 import mimetypes
+import threading
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Generator, Tuple
 
@@ -9,6 +10,7 @@ from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaIoBaseDownload
 
 from ..auth.google_auth import GoogleAuthManager
+from ..utils.retry import call_with_retry
 
 
 class GoogleDriveService:
@@ -33,6 +35,7 @@ class GoogleDriveService:
         self.auth_manager = auth_manager
         self.service = None
         self.logger = logging.getLogger(__name__)
+        self._thread_local = threading.local()
         self._initialize_service()
     
     def _initialize_service(self) -> None:
@@ -48,6 +51,22 @@ class GoogleDriveService:
             self.logger.error(f"Failed to initialize Google Drive service: {str(e)}")
             raise
     
+    def _get_thread_service(self):
+        """
+        Get a Drive service for the calling thread.
+        
+        The underlying httplib2 connection is not thread-safe, so worker
+        threads each build their own service on first use.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return self.service
+        
+        service = getattr(self._thread_local, 'service', None)
+        if service is None:
+            service = self.auth_manager.get_drive_service()
+            self._thread_local.service = service
+        return service
+    
     def list_folders(self, parent_folder_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List folders in Google Drive.
@@ -63,11 +82,11 @@ class GoogleDriveService:
             if parent_folder_id:
                 query += f" and '{parent_folder_id}' in parents"
             
-            results = self.service.files().list(
+            results = call_with_retry(self.service.files().list(
                 q=query,
                 pageSize=100,
                 fields="nextPageToken, files(id, name, parents, createdTime, modifiedTime)"
-            ).execute()
+            ).execute)
             
             folders = results.get('files', [])
             self.logger.info(f"Found {len(folders)} folders")
@@ -97,12 +116,12 @@ class GoogleDriveService:
             total_files = 0
             
             while True:
-                results = self.service.files().list(
+                results = call_with_retry(self.service.files().list(
                     q=query,
                     pageSize=page_size,
                     pageToken=page_token,
                     fields="nextPageToken, files(id, name, size, mimeType, createdTime, modifiedTime, md5Checksum)"
-                ).execute()
+                ).execute)
                 
                 files = results.get('files', [])
                 if not files:
@@ -133,10 +152,10 @@ class GoogleDriveService:
             Dictionary with folder information or None if not found
         """
         try:
-            file_info = self.service.files().get(
+            file_info = call_with_retry(self.service.files().get(
                 fileId=folder_id,
                 fields="id, name, parents, createdTime, modifiedTime, mimeType"
-            ).execute()
+            ).execute)
             
             # Verify it's actually a folder
             if file_info.get('mimeType') != 'application/vnd.google-apps.folder':
@@ -165,20 +184,19 @@ class GoogleDriveService:
             bool: True if download successful, False otherwise
         """
         try:
-            # Get file metadata first
-            file_metadata = self.service.files().get(fileId=file_id).execute()
+            service = self._get_thread_service()
             
             # Create output directory if it doesn't exist
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Download file
-            request = self.service.files().get_media(fileId=file_id)
+            request = service.files().get_media(fileId=file_id)
             file_io = io.BytesIO()
             downloader = MediaIoBaseDownload(file_io, request)
             
             done = False
             while done is False:
-                status, done = downloader.next_chunk()
+                status, done = call_with_retry(downloader.next_chunk)
                 if status:
                     progress = int(status.progress() * 100)
                     self.logger.debug(f"Download progress: {progress}%")
@@ -187,7 +205,7 @@ class GoogleDriveService:
             with open(output_path, 'wb') as f:
                 f.write(file_io.getvalue())
             
-            self.logger.debug(f"Downloaded {file_metadata['name']} to {output_path}")
+            self.logger.debug(f"Downloaded {file_id} to {output_path}")
             return True
             
         except HttpError as e:
@@ -208,10 +226,10 @@ class GoogleDriveService:
             Dictionary with file information or None if not found
         """
         try:
-            file_info = self.service.files().get(
+            file_info = call_with_retry(self.service.files().get(
                 fileId=file_id,
                 fields="id, name, size, mimeType, createdTime, modifiedTime, md5Checksum, parents"
-            ).execute()
+            ).execute)
             
             return file_info
             
@@ -236,11 +254,11 @@ class GoogleDriveService:
         try:
             query = f"mimeType='application/vnd.google-apps.folder' and name contains '{folder_name}' and trashed=false"
             
-            results = self.service.files().list(
+            results = call_with_retry(self.service.files().list(
                 q=query,
                 pageSize=50,
                 fields="nextPageToken, files(id, name, parents, createdTime, modifiedTime)"
-            ).execute()
+            ).execute)
             
             folders = results.get('files', [])
             self.logger.info(f"Found {len(folders)} folders matching '{folder_name}'")
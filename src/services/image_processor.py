@@ -1,7 +1,8 @@
 import tempfile
 import logging
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..auth.google_auth import GoogleAuthManager
@@ -36,17 +37,23 @@ class ImageProcessor:
         self.cache_manager = CacheManager(config.storage)
         self.duplicate_detector = DuplicateDetector(config.storage)
         
+        # Cache index updates are serialized across download workers
+        self._cache_lock = threading.Lock()
+        
         # Initialize OCR and processing
         self.ocr_engine = OCREngine(config.processing, auth_manager)
         self.receipt_parser = ReceiptParser()
         self.receipt_validator = ReceiptValidator(config.processing.confidence_threshold)
+        self.ocr_cache = self.cache_manager.ocr_cache
     
-    def process_drive_folder(self, folder_id: str) -> Dict[str, Any]:
+    def process_drive_folder(self, folder_id: str,
+                             on_file_processed: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Process all images in a Google Drive folder.
         
         Args:
             folder_id: Google Drive folder ID
+            on_file_processed: Optional callback invoked with each file result as soon as it completes
             
         Returns:
             Dict with processing results
@@ -61,24 +68,33 @@ class ImageProcessor:
             
             self.logger.info(f"Processing folder: {folder_info['name']}")
             
-            # Get folder size info
-            size_info = self.drive_service.get_folder_size_info(folder_id)
-            self.logger.info(f"Folder contains {size_info['image_files']} images ({size_info['total_size_mb']} MB)")
+            # List folder contents once; size info is derived from the listing
+            drive_files = list(self.drive_service.list_images_in_folder(folder_id))
+            total_size = sum(int(f.get('size') or 0) for f in drive_files)
+            self.logger.info(f"Folder contains {len(drive_files)} images ({round(total_size / (1024 * 1024), 2)} MB)")
             
-            # Process images
+            # Process images, downloading concurrently
             processed_files = []
             skipped_files = []
             error_files = []
             
-            for file_info in self.drive_service.list_images_in_folder(folder_id):
-                result = self._process_single_drive_file(file_info)
+            max_workers = self.config.processing.max_concurrent_downloads
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._process_single_drive_file, f) for f in drive_files]
                 
-                if result['status'] == 'processed':
-                    processed_files.append(result)
-                elif result['status'] == 'skipped':
-                    skipped_files.append(result)
-                else:
-                    error_files.append(result)
+                # Hand results on in completion order so later stages don't wait on slow downloads
+                if on_file_processed:
+                    for future in as_completed(futures):
+                        on_file_processed(future.result())
+                
+                for future in futures:
+                    result = future.result()
+                    if result['status'] == 'processed':
+                        processed_files.append(result)
+                    elif result['status'] == 'skipped':
+                        skipped_files.append(result)
+                    else:
+                        error_files.append(result)
             
             # Find duplicates if enabled
             duplicates = []
@@ -92,7 +108,7 @@ class ImageProcessor:
                 'source_type': 'google_drive',
                 'source_id': folder_id,
                 'source_name': folder_info['name'],
-                'total_files_found': size_info['image_files'],
+                'total_files_found': len(drive_files),
                 'processed_files': len(processed_files),
                 'skipped_files': len(skipped_files),
                 'error_files': len(error_files),
@@ -110,12 +126,14 @@ class ImageProcessor:
             self.logger.error(f"Failed to process Drive folder {folder_id}: {str(e)}")
             raise
     
-    def process_photos_album(self, album_id: str) -> Dict[str, Any]:
+    def process_photos_album(self, album_id: str,
+                             on_file_processed: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Process all images in a Google Photos album.
         
         Args:
             album_id: Google Photos album ID
+            on_file_processed: Optional callback invoked with each file result as soon as it completes
             
         Returns:
             Dict with processing results
@@ -141,6 +159,8 @@ class ImageProcessor:
             
             for media_item in self.photos_service.list_media_items_in_album(album_id):
                 result = self._process_single_photos_item(media_item)
+                if on_file_processed:
+                    on_file_processed(result)
                 
                 if result['status'] == 'processed':
                     processed_files.append(result)
@@ -194,16 +214,19 @@ class ImageProcessor:
         
         try:
             # Check if already cached
-            if self.cache_manager.is_file_cached(file_id):
-                cached_path = self.cache_manager.get_cached_file_path_by_id(file_id)
-                if cached_path and cached_path.exists():
-                    return {
-                        'status': 'skipped',
-                        'reason': 'already_cached',
-                        'file_id': file_id,
-                        'file_name': file_name,
-                        'cache_path': str(cached_path)
-                    }
+            with self._cache_lock:
+                cached_path = None
+                if self.cache_manager.is_file_cached(file_id):
+                    cached_path = self.cache_manager.get_cached_file_path_by_id(file_id)
+            
+            if cached_path and cached_path.exists():
+                return {
+                    'status': 'skipped',
+                    'reason': 'already_cached',
+                    'file_id': file_id,
+                    'file_name': file_name,
+                    'cache_path': str(cached_path)
+                }
             
             # Download to temporary file first
             with tempfile.NamedTemporaryFile(suffix=Path(file_name).suffix, delete=False) as temp_file:
@@ -218,9 +241,11 @@ class ImageProcessor:
                 }
             
             # Add to cache
-            if self.cache_manager.add_file_to_cache(file_id, temp_path, file_info):
-                cached_path = self.cache_manager.get_cached_file_path_by_id(file_id)
-                
+            with self._cache_lock:
+                cached = self.cache_manager.add_file_to_cache(file_id, temp_path, file_info)
+                cached_path = self.cache_manager.get_cached_file_path_by_id(file_id) if cached else None
+            
+            if cached:
                 # Clean up temp file
                 temp_path.unlink(missing_ok=True)
                 
@@ -373,33 +398,8 @@ class ImageProcessor:
         try:
             self.logger.info(f"Starting OCR processing of Google Drive folder: {folder_id}")
             
-            # First get basic processing results
-            basic_results = self.process_drive_folder(folder_id)
-            
-            if not basic_results['success']:
-                return basic_results
-            
-            # Process each cached image with OCR
-            ocr_results = []
-            processed_files = basic_results.get('files', [])
-            
-            for i, file_info in enumerate(processed_files):
-                if file_info['status'] != 'processed' or not file_info.get('cache_path'):
-                    continue
-                
-                self.logger.info(f"OCR processing {i+1}/{len(processed_files)}: {file_info['file_name']}")
-                
-                try:
-                    ocr_result = self._process_single_image_ocr(Path(file_info['cache_path']), file_info)
-                    ocr_results.append(ocr_result)
-                except Exception as e:
-                    self.logger.error(f"OCR failed for {file_info['file_name']}: {str(e)}")
-                    ocr_results.append({
-                        'file_id': file_info['file_id'],
-                        'file_name': file_info['file_name'],
-                        'success': False,
-                        'error': str(e)
-                    })
+            # Download and OCR together; each image is OCR'd as soon as it is cached
+            basic_results, ocr_results = self._process_with_pipelined_ocr(self.process_drive_folder, folder_id)
             
             # Add OCR results to basic results
             basic_results['ocr_results'] = ocr_results
@@ -426,33 +426,8 @@ class ImageProcessor:
         try:
             self.logger.info(f"Starting OCR processing of Google Photos album: {album_id}")
             
-            # First get basic processing results
-            basic_results = self.process_photos_album(album_id)
-            
-            if not basic_results['success']:
-                return basic_results
-            
-            # Process each cached image with OCR
-            ocr_results = []
-            processed_files = basic_results.get('files', [])
-            
-            for i, file_info in enumerate(processed_files):
-                if file_info['status'] != 'processed' or not file_info.get('cache_path'):
-                    continue
-                
-                self.logger.info(f"OCR processing {i+1}/{len(processed_files)}: {file_info['file_name']}")
-                
-                try:
-                    ocr_result = self._process_single_image_ocr(Path(file_info['cache_path']), file_info)
-                    ocr_results.append(ocr_result)
-                except Exception as e:
-                    self.logger.error(f"OCR failed for {file_info['file_name']}: {str(e)}")
-                    ocr_results.append({
-                        'file_id': file_info['file_id'],
-                        'file_name': file_info['file_name'],
-                        'success': False,
-                        'error': str(e)
-                    })
+            # Download and OCR together; each image is OCR'd as soon as it is cached
+            basic_results, ocr_results = self._process_with_pipelined_ocr(self.process_photos_album, album_id)
             
             # Add OCR results to basic results
             basic_results['ocr_results'] = ocr_results
@@ -466,6 +441,78 @@ class ImageProcessor:
             self.logger.error(f"OCR processing failed for Photos album {album_id}: {str(e)}")
             raise
     
+    def _process_with_pipelined_ocr(self, process_source: Callable[..., Dict[str, Any]],
+                                    source_id: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Run a source's download stage with OCR overlapped on finished files.
+        
+        Each downloaded image is queued for OCR as soon as it is cached, so
+        OCR workers start while later files are still downloading. Tesseract
+        runs as a subprocess and Vision API calls wait on the network, so a
+        thread pool keeps several images in flight without having to pickle
+        the OCR engine into worker processes.
+        
+        Args:
+            process_source: process_drive_folder or process_photos_album
+            source_id: Folder or album ID passed to process_source
+            
+        Returns:
+            Tuple of the download results (with tier metrics when tiered OCR
+            is enabled) and OCR results in file order
+        """
+        ocr_futures = {}
+        tier_stats_before = self.ocr_engine.get_tier_stats()
+        
+        with ThreadPoolExecutor(max_workers=self.config.processing.ocr_workers) as ocr_executor:
+            def _queue_ocr(file_result: Dict[str, Any]) -> None:
+                if file_result['status'] == 'processed' and file_result.get('cache_path'):
+                    ocr_futures[file_result['file_id']] = ocr_executor.submit(self._ocr_processed_file, file_result)
+            
+            basic_results = process_source(source_id, on_file_processed=_queue_ocr)
+            
+            ocr_results = [
+                ocr_futures[f['file_id']].result()
+                for f in basic_results.get('files', [])
+                if f['file_id'] in ocr_futures
+            ]
+        
+        # Report this run's tier decisions; the engine's counters cover every
+        # source processed by this ImageProcessor, not just this one
+        if self.config.processing.tier1_threshold is not None:
+            tier_stats = self.ocr_engine.get_tier_stats()
+            tier1_hits = tier_stats['tier1_hits'] - tier_stats_before['tier1_hits']
+            tier2_upgrades = tier_stats['tier2_upgrades'] - tier_stats_before['tier2_upgrades']
+            tiered_total = tier1_hits + tier2_upgrades
+            basic_results['tier1_hits'] = tier1_hits
+            basic_results['tier2_upgrades'] = tier2_upgrades
+            basic_results['ocr_upgrade_ratio'] = tier2_upgrades / tiered_total if tiered_total else 0.0
+            self.logger.info(f"Tiered OCR: {tier1_hits} tier 1 hits, {tier2_upgrades} upgraded ({basic_results['ocr_upgrade_ratio']:.1%})")
+        
+        return basic_results, ocr_results
+    
+    def _ocr_processed_file(self, file_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run OCR and data extraction on a downloaded file.
+        
+        Args:
+            file_info: File result from the download stage
+            
+        Returns:
+            Dict with OCR results
+        """
+        self.logger.info(f"OCR processing: {file_info['file_name']}")
+        
+        try:
+            return self._process_single_image_ocr(Path(file_info['cache_path']), file_info)
+        except Exception as e:
+            self.logger.error(f"OCR failed for {file_info['file_name']}: {str(e)}")
+            return {
+                'file_id': file_info['file_id'],
+                'file_name': file_info['file_name'],
+                'success': False,
+                'error': str(e)
+            }
+    
     def _process_single_image_ocr(self, image_path: Path, file_info: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process a single image with OCR and data extraction.
@@ -478,6 +525,20 @@ class ImageProcessor:
             Dict with OCR results
         """
         try:
+            # Reuse the stored result if this exact image was already processed
+            cache_key = None
+            if self.config.processing.use_ocr_cache:
+                cache_key = self.ocr_cache.make_key(self._get_content_hash(file_info['file_id'], image_path), self.config.processing)
+                cached_result = self.ocr_cache.get(cache_key)
+                if cached_result:
+                    self.logger.debug(f"Using cached OCR result for {file_info['file_name']}")
+                    cached_result.update({
+                        'file_id': file_info['file_id'],
+                        'file_name': file_info['file_name'],
+                        'from_cache': True
+                    })
+                    return cached_result
+            
             # Step 1: OCR processing
             ocr_result = self.ocr_engine.process_receipt_image(image_path)
             
@@ -516,6 +577,9 @@ class ImageProcessor:
                     'quality_metrics': ocr_result.get('quality_metrics', {})
                 }
                 
+                if cache_key:
+                    self.ocr_cache.put(cache_key, result)
+                
                 return result
             
             else:
@@ -538,6 +602,13 @@ class ImageProcessor:
                 'error': str(e)
             }
     
+    def _get_content_hash(self, file_id: str, image_path: Path) -> str:
+        """Get the content hash for a cached image, computing it if not indexed."""
+        cache_info = self.cache_manager.get_cached_file_info(file_id)
+        if cache_info and cache_info.get('content_hash'):
+            return cache_info['content_hash']
+        return self.cache_manager.calculate_file_hash(image_path)
+    
     def get_ocr_engine_status(self) -> Dict[str, Any]:
         """Get OCR engine status and capabilities."""
         return self.ocr_engine.get_engine_status()
\ No newline at end of file
@@ -9,6 +9,7 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from ..auth.google_auth import GoogleAuthManager
+from ..utils.retry import call_with_retry
 
 
 class GooglePhotosService:
@@ -23,6 +24,7 @@ class GooglePhotosService:
         """
         self.auth_manager = auth_manager
         self.service = None
+        self.http_session = None
         self.logger = logging.getLogger(__name__)
         self._initialize_service()
     
@@ -33,6 +35,7 @@ class GooglePhotosService:
                 raise RuntimeError("Not authenticated with Google services")
             
             self.service = self.auth_manager.get_photos_service()
+            self.http_session = self.auth_manager.get_http_session()
             self.logger.info("Google Photos service initialized")
             
         except Exception as e:
@@ -58,7 +61,7 @@ class GooglePhotosService:
                 if page_token:
                     request_body['pageToken'] = page_token
                 
-                response = self.service.albums().list(**request_body).execute()
+                response = call_with_retry(self.service.albums().list(**request_body).execute)
                 
                 batch_albums = response.get('albums', [])
                 albums.extend(batch_albums)
@@ -85,7 +88,7 @@ class GooglePhotosService:
             Dictionary with album information or None if not found
         """
         try:
-            album = self.service.albums().get(albumId=album_id).execute()
+            album = call_with_retry(self.service.albums().get(albumId=album_id).execute)
             return album
             
         except HttpError as e:
@@ -119,7 +122,7 @@ class GooglePhotosService:
                 if page_token:
                     request_body['pageToken'] = page_token
                 
-                response = self.service.mediaItems().search(body=request_body).execute()
+                response = call_with_retry(self.service.mediaItems().search(body=request_body).execute)
                 
                 media_items = response.get('mediaItems', [])
                 if not media_items:
@@ -179,14 +182,14 @@ class GooglePhotosService:
             # Create output directory if it doesn't exist
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Download the image
-            response = requests.get(download_url, stream=True)
-            response.raise_for_status()
-            
-            # Write to file
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Download the image over the pooled session
+            with self.http_session.get(download_url, stream=True) as response:
+                response.raise_for_status()
+                
+                # Write to file
+                with open(output_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
             
             self.logger.debug(f"Downloaded {media_item.get('filename', 'Unknown')} to {output_path}")
             return True
@@ -209,7 +212,7 @@ class GooglePhotosService:
             Dictionary with media item information or None if not found
         """
         try:
-            media_item = self.service.mediaItems().get(mediaItemId=media_item_id).execute()
+            media_item = call_with_retry(self.service.mediaItems().get(mediaItemId=media_item_id).execute)
             return media_item
             
         except HttpError as e:
@@ -331,7 +334,7 @@ class GooglePhotosService:
                 if page_token:
                     request_body['pageToken'] = page_token
                 
-                response = self.service.mediaItems().search(body=request_body).execute()
+                response = call_with_retry(self.service.mediaItems().search(body=request_body).execute)
                 
                 media_items = response.get('mediaItems', [])
                 if not media_items:
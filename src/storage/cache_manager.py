@@ -1,4 +1,5 @@
 import os
+import mmap
 import json
 import hashlib
 import logging
@@ -8,11 +9,16 @@ from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 
 from ..utils.config import StorageConfig
+from .ocr_cache import OCRResultCache
 
 
 class CacheManager:
     """Manages local caching of downloaded images and metadata."""
     
+    # Recorded on every index entry so content hashes from older releases
+    # (MD5) are recognised and recomputed
+    HASH_ALGORITHM = 'blake2b-128'
+    
     def __init__(self, config: StorageConfig):
         """
         Initialize cache manager.
@@ -30,11 +36,15 @@ class CacheManager:
         self.images_dir.mkdir(exist_ok=True)
         self.metadata_dir.mkdir(exist_ok=True)
         
+        # OCR results live under the same cache directory and size budget
+        self.ocr_cache = OCRResultCache(config)
+        
         # Cache index file
         self.index_file = self.cache_dir / 'cache_index.json'
         self.cache_index = self._load_cache_index()
         
         self.logger = logging.getLogger(__name__)
+        self._migrate_legacy_hashes()
     
     def _load_cache_index(self) -> Dict[str, Any]:
         """Load cache index from file."""
@@ -56,6 +66,43 @@ class CacheManager:
             }
         }
     
+    def _migrate_legacy_hashes(self) -> None:
+        """Rehash index entries whose content hash predates HASH_ALGORITHM."""
+        files = self.cache_index['files']
+        legacy_ids = [file_id for file_id, cache_info in files.items()
+                      if cache_info.get('hash_algorithm') != self.HASH_ALGORITHM]
+        if not legacy_ids:
+            return
+        
+        self.logger.info(f"Rehashing {len(legacy_ids)} cached files with {self.HASH_ALGORITHM}")
+        
+        # Rehash stored copies first so duplicates can take their new hash
+        for file_id in legacy_ids:
+            cache_info = files[file_id]
+            if cache_info.get('is_duplicate'):
+                continue
+            try:
+                cache_info['content_hash'] = self.calculate_file_hash(Path(cache_info['cache_path']))
+            except Exception:
+                # Copy is gone; the entry can no longer anchor duplicates
+                cache_info['content_hash'] = None
+            cache_info['hash_algorithm'] = self.HASH_ALGORITHM
+        
+        for file_id in legacy_ids:
+            cache_info = files[file_id]
+            if not cache_info.get('is_duplicate'):
+                continue
+            original_info = files.get(cache_info.get('cache_file_id'), {})
+            cache_info['content_hash'] = original_info.get('content_hash')
+            cache_info['hash_algorithm'] = self.HASH_ALGORITHM
+        
+        self.cache_index['hashes'] = {
+            cache_info['content_hash']: file_id
+            for file_id, cache_info in files.items()
+            if not cache_info.get('is_duplicate') and cache_info.get('content_hash')
+        }
+        self._save_cache_index()
+    
     def _save_cache_index(self) -> None:
         """Save cache index to file."""
         try:
@@ -66,20 +113,26 @@ class CacheManager:
     
     def calculate_file_hash(self, file_path: Path) -> str:
         """
-        Calculate MD5 hash of a file.
+        Calculate BLAKE2b content hash of a file.
         
         Args:
             file_path: Path to file
             
         Returns:
-            str: MD5 hash of file content
+            str: 128-bit BLAKE2b hash of file content (hex)
         """
-        hash_md5 = hashlib.md5()
+        hasher = hashlib.blake2b(digest_size=16)
         try:
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+                # Empty files can't be memory-mapped
+                if os.fstat(f.fileno()).st_size == 0:
+                    return hasher.hexdigest()
+                
+                # Hash straight from the page cache; pages are loaded on demand
+                # and never copied into Python bytes objects
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+            return hasher.hexdigest()
         except Exception as e:
             self.logger.error(f"Failed to calculate hash for {file_path}: {str(e)}")
             raise
@@ -155,6 +208,7 @@ class CacheManager:
                     'cache_file_id': existing_file_id,
                     'is_duplicate': True,
                     'content_hash': file_hash,
+                    'hash_algorithm': self.HASH_ALGORITHM,
                     'cached_at': datetime.now().isoformat(),
                     'metadata': metadata
                 }
@@ -177,6 +231,7 @@ class CacheManager:
                 'cache_file_id': file_id,
                 'cache_path': str(cache_path),
                 'content_hash': file_hash,
+                'hash_algorithm': self.HASH_ALGORITHM,
                 'file_size': file_size,
                 'cached_at': datetime.now().isoformat(),
                 'last_accessed': datetime.now().isoformat(),
@@ -303,6 +358,10 @@ class CacheManager:
                     files_removed += 1
                     bytes_freed += cache_info.get('file_size', 0)
             
+            ocr_stats = self.ocr_cache.cleanup(max_age_days)
+            files_removed += ocr_stats['files_removed']
+            bytes_freed += ocr_stats['bytes_freed']
+            
             # Update cleanup timestamp
             self.cache_index['stats']['last_cleanup'] = datetime.now().isoformat()
             self._save_cache_index()
@@ -329,7 +388,8 @@ class CacheManager:
         """
         try:
             max_size_bytes = self.config.max_cache_size_mb * 1024 * 1024
-            current_size = self.cache_index['stats']['total_size_bytes']
+            ocr_size = self.ocr_cache.get_total_size()
+            current_size = self.cache_index['stats']['total_size_bytes'] + ocr_size
             
             if current_size <= max_size_bytes:
                 return {'files_removed': 0, 'bytes_freed': 0, 'mb_freed': 0}
@@ -354,6 +414,11 @@ class CacheManager:
                     files_removed += 1
                     bytes_freed += file_size
             
+            # Images alone may fit yet leave no room for OCR results
+            ocr_stats = self.ocr_cache.enforce_size_limit(max_size_bytes - (current_size - ocr_size - bytes_freed))
+            files_removed += ocr_stats['files_removed']
+            bytes_freed += ocr_stats['bytes_freed']
+            
             enforcement_stats = {
                 'files_removed': files_removed,
                 'bytes_freed': bytes_freed,
@@ -375,9 +440,11 @@ class CacheManager:
             Dict with cache statistics
         """
         stats = self.cache_index['stats'].copy()
-        stats['mb_used'] = round(stats['total_size_bytes'] / (1024 * 1024), 2)
+        stats['ocr_results_bytes'] = self.ocr_cache.get_total_size()
+        used_bytes = stats['total_size_bytes'] + stats['ocr_results_bytes']
+        stats['mb_used'] = round(used_bytes / (1024 * 1024), 2)
         stats['max_size_mb'] = self.config.max_cache_size_mb
-        stats['usage_percent'] = round((stats['total_size_bytes'] / (self.config.max_cache_size_mb * 1024 * 1024)) * 100, 1)
+        stats['usage_percent'] = round((used_bytes / (self.config.max_cache_size_mb * 1024 * 1024)) * 100, 1)
         
         # Count duplicates
         duplicate_count = sum(1 for info in self.cache_index['files'].values() if info.get('is_duplicate'))
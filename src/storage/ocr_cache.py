@@ -0,0 +1,173 @@
+import os
+import json
+import time
+import hashlib
+import threading
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple
+
+from ..utils.config import StorageConfig, ProcessingConfig
+
+
+class OCRResultCache:
+    """Persistent cache of OCR results keyed by image content hash."""
+    
+    def __init__(self, config: StorageConfig):
+        """
+        Initialize OCR result cache.
+        
+        Args:
+            config: Storage configuration
+        """
+        self.config = config
+        self.results_dir = Path(config.cache_directory) / 'ocr_results'
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+    
+    def make_key(self, content_hash: str, processing_config: ProcessingConfig) -> str:
+        """
+        Build a cache key for an image and the settings that affect its OCR output.
+        
+        Args:
+            content_hash: Hash of the image content
+            processing_config: Processing configuration used for OCR
+            
+        Returns:
+            str: Cache key
+        """
+        fingerprint = '|'.join([
+            content_hash,
+            str(processing_config.use_opencv_preprocessing),
+            str(processing_config.fallback_to_tesseract),
+            str(processing_config.confidence_threshold),
+            str(processing_config.max_image_size),
+            str(processing_config.tier1_threshold),
+            str(processing_config.tier1_max_size)
+        ])
+        return hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached OCR result.
+        
+        Args:
+            key: Cache key from make_key()
+            
+        Returns:
+            Cached result dict or None if not cached
+        """
+        result_path = self.results_dir / f"{key}.json"
+        try:
+            with open(result_path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+            # mtime doubles as last-used time for eviction
+            os.utime(result_path)
+            return result
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Failed to read cached OCR result {key}: {str(e)}")
+            return None
+    
+    def put(self, key: str, result: Dict[str, Any]) -> bool:
+        """
+        Store an OCR result.
+        
+        Args:
+            key: Cache key from make_key()
+            result: OCR result to cache
+            
+        Returns:
+            bool: True if successful
+        """
+        result_path = self.results_dir / f"{key}.json"
+        # Unique per writer so concurrent puts of the same key never share a temp file
+        temp_path = result_path.with_name(f"{result_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, default=str)
+            os.replace(temp_path, result_path)
+            return True
+        except Exception as e:
+            temp_path.unlink(missing_ok=True)
+            self.logger.warning(f"Failed to cache OCR result {key}: {str(e)}")
+            return False
+    
+    def _list_results(self) -> List[Tuple[float, int, Path]]:
+        """List cached results as (mtime, size, path), least recently used first."""
+        entries = []
+        for result_path in self.results_dir.glob('*.json'):
+            try:
+                stat = result_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, result_path))
+        entries.sort()
+        return entries
+    
+    def get_total_size(self) -> int:
+        """
+        Get the total size of cached OCR results.
+        
+        Returns:
+            int: Size in bytes
+        """
+        return sum(size for _, size, _ in self._list_results())
+    
+    def cleanup(self, max_age_days: int = 30) -> Dict[str, Any]:
+        """
+        Remove OCR results not used within max_age_days.
+        
+        Args:
+            max_age_days: Maximum age of results to keep
+            
+        Returns:
+            Dict with cleanup statistics
+        """
+        cutoff = time.time() - max_age_days * 86400
+        stale = [(size, path) for mtime, size, path in self._list_results() if mtime < cutoff]
+        return self._remove_results(stale)
+    
+    def enforce_size_limit(self, max_size_bytes: int) -> Dict[str, Any]:
+        """
+        Remove least recently used OCR results until under max_size_bytes.
+        
+        Args:
+            max_size_bytes: Size budget for cached results
+            
+        Returns:
+            Dict with eviction statistics
+        """
+        entries = self._list_results()
+        excess = sum(size for _, size, _ in entries) - max_size_bytes
+        
+        to_remove = []
+        for _, size, path in entries:
+            if excess <= 0:
+                break
+            to_remove.append((size, path))
+            excess -= size
+        
+        return self._remove_results(to_remove)
+    
+    def _remove_results(self, results: List[Tuple[int, Path]]) -> Dict[str, Any]:
+        """Delete (size, path) result files and summarise what was freed."""
+        files_removed = 0
+        bytes_freed = 0
+        
+        for size, path in results:
+            try:
+                path.unlink()
+                files_removed += 1
+                bytes_freed += size
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                self.logger.warning(f"Failed to remove cached OCR result {path.name}: {str(e)}")
+        
+        return {
+            'files_removed': files_removed,
+            'bytes_freed': bytes_freed,
+            'mb_freed': round(bytes_freed / (1024 * 1024), 2)
+        }
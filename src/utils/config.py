@@ -1,11 +1,16 @@
 import os
 import yaml
 import json
+import copy
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass, asdict
 
+# Use libyaml's C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 @dataclass
 class ProcessingConfig:
@@ -14,11 +19,18 @@ class ProcessingConfig:
     max_image_size: int = 2048
     use_opencv_preprocessing: bool = True
     fallback_to_tesseract: bool = True
+    max_concurrent_downloads: int = 8
+    use_ocr_cache: bool = True
+    ocr_workers: Optional[int] = None
+    tier1_threshold: Optional[float] = None
+    tier1_max_size: int = 640
     supported_formats: list = None
     
     def __post_init__(self):
         if self.supported_formats is None:
             self.supported_formats = ['.jpg', '.jpeg', '.png', '.tiff', '.bmp']
+        if self.ocr_workers is None:
+            self.ocr_workers = os.cpu_count() or 1
 
 
 @dataclass
@@ -29,6 +41,7 @@ class ExportConfig:
     include_confidence_scores: bool = True
     include_raw_text: bool = False
     date_format: str = '%Y-%m-%d'
+    pretty_json: bool = True
 
 
 @dataclass
@@ -59,6 +72,28 @@ class AppConfig:
             self.storage = StorageConfig(**self.storage)
 
 
+@lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime: float) -> Any:
+    """
+    Parse a YAML or JSON configuration file.
+    
+    Results are cached per path and modification time, so an unchanged
+    file is only parsed once per process.
+    
+    Args:
+        path: Path to configuration file
+        mtime: File modification time, used as part of the cache key
+        
+    Returns:
+        Parsed file contents
+    """
+    with open(path, 'r') as f:
+        if Path(path).suffix.lower() in ['.yaml', '.yml']:
+            return yaml.load(f, Loader=_YAML_LOADER)
+        else:
+            return json.load(f)
+
+
 class ConfigManager:
     """Manages application configuration from files and environment variables."""
     
@@ -178,12 +213,9 @@ class ConfigManager:
                 self.logger.warning(f"Configuration file not found: {file_path}")
                 return None
             
-            with open(path, 'r') as f:
-                if path.suffix.lower() in ['.yaml', '.yml']:
-                    return yaml.safe_load(f)
-                else:
-                    return json.load(f)
-                    
+            # Copy so callers can't mutate the cached parse
+            return copy.deepcopy(_parse_config_file(str(path), path.stat().st_mtime))
+            
         except Exception as e:
             self.logger.error(f"Failed to load configuration file {file_path}: {str(e)}")
             return None
@@ -243,6 +275,18 @@ class ConfigManager:
         if config.processing.max_image_size <= 0:
             raise ValueError("Max image size must be positive")
         
+        if config.processing.max_concurrent_downloads <= 0:
+            raise ValueError("Max concurrent downloads must be positive")
+        
+        if config.processing.ocr_workers <= 0:
+            raise ValueError("OCR workers must be positive")
+        
+        if config.processing.tier1_threshold is not None and not 0.0 <= config.processing.tier1_threshold <= 1.0:
+            raise ValueError("Tier 1 threshold must be between 0.0 and 1.0")
+        
+        if config.processing.tier1_max_size <= 0:
+            raise ValueError("Tier 1 max size must be positive")
+        
         if config.export.output_format.lower() not in ['csv', 'xlsx', 'json']:
             raise ValueError("Output format must be 'csv', 'xlsx', or 'json'")
         
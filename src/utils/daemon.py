@@ -0,0 +1,137 @@
+import io
+import os
+import json
+import stat
+import socket
+import logging
+import socketserver
+from contextlib import redirect_stdout, redirect_stderr
+from typing import Callable, List, Optional
+
+DEFAULT_SOCKET_PATH = os.getenv('RECEIPT_SCANNER_SOCKET', '/tmp/receipt-scanner.sock')
+
+logger = logging.getLogger(__name__)
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    """Runs one CLI command per connection and sends back its output."""
+    
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            # Liveness probe from serve(); the client sent nothing
+            return
+        
+        try:
+            request = json.loads(line.decode('utf-8'))
+            argv = [str(arg) for arg in request['argv']]
+            cwd = request.get('cwd')
+        except Exception as e:
+            self._respond(2, f"Invalid daemon request: {str(e)}\n")
+            return
+        
+        output = io.StringIO()
+        with redirect_stdout(output), redirect_stderr(output):
+            try:
+                exit_code = self.server.command_handler(argv, cwd)
+            except SystemExit as e:
+                # argparse exits on --help and usage errors
+                exit_code = e.code if isinstance(e.code, int) else 1
+            except Exception as e:
+                logger.error(f"Daemon command failed: {str(e)}")
+                print(f"ERROR: {str(e)}")
+                exit_code = 1
+        
+        self._respond(exit_code or 0, output.getvalue())
+    
+    def _respond(self, exit_code: int, output: str) -> None:
+        response = json.dumps({'exit_code': exit_code, 'output': output})
+        self.wfile.write(response.encode('utf-8') + b'\n')
+
+
+def serve(command_handler: Callable[[List[str], Optional[str]], int],
+          socket_path: str = DEFAULT_SOCKET_PATH) -> bool:
+    """
+    Serve CLI commands over a Unix socket until interrupted.
+    
+    Commands run one at a time in this process, so anything the handler
+    keeps between calls (credentials, HTTP connection pools, parsed
+    configuration) is reused by every command.
+    
+    Args:
+        command_handler: Callable taking an argv list and the client's working
+            directory (None if not sent) and returning an exit code
+        socket_path: Path of the Unix socket to listen on
+        
+    Returns:
+        bool: False if another daemon is already listening on socket_path,
+        True once this daemon has shut down
+    """
+    if _daemon_listening(socket_path):
+        logger.error(f"A daemon is already running on {socket_path}")
+        return False
+    
+    with socketserver.UnixStreamServer(socket_path, _CommandHandler) as server:
+        server.command_handler = command_handler
+        os.chmod(socket_path, 0o600)
+        bound = os.stat(socket_path)
+        logger.info(f"Daemon listening on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Daemon shutting down")
+        finally:
+            # Leave the path alone if another daemon has since replaced it
+            try:
+                current = os.stat(socket_path)
+                if (current.st_dev, current.st_ino) == (bound.st_dev, bound.st_ino):
+                    os.unlink(socket_path)
+            except FileNotFoundError:
+                pass
+    
+    return True
+
+
+def _daemon_listening(socket_path: str) -> bool:
+    """
+    Check for a live daemon on socket_path, removing a stale socket file.
+    
+    Returns:
+        bool: True if a daemon accepted a connection on the socket
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+        return True
+    except FileNotFoundError:
+        return False
+    except ConnectionRefusedError:
+        # Left behind by a daemon that didn't shut down cleanly
+        if stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.unlink(socket_path)
+        return False
+
+
+def send_command(argv: List[str], socket_path: str = DEFAULT_SOCKET_PATH) -> Optional[dict]:
+    """
+    Send a CLI command to a running daemon.
+    
+    The caller's working directory is sent along so the daemon can resolve
+    relative paths in the command the way a local run would.
+    
+    Args:
+        argv: Command line arguments to run
+        socket_path: Path of the daemon's Unix socket
+        
+    Returns:
+        Dict with 'exit_code' and 'output', or None if no daemon is running
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            request = {'argv': argv, 'cwd': os.getcwd()}
+            sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            with sock.makefile('rb') as response:
+                return json.loads(response.readline().decode('utf-8'))
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
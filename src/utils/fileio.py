@@ -0,0 +1,45 @@
+import os
+from pathlib import Path
+from typing import Union
+
+import orjson
+
+
+def write_bytes(file_path: Union[str, Path], payload: bytes) -> None:
+    """
+    Write an in-memory payload to a file with raw os.write calls.
+    
+    The payload is already one contiguous buffer (e.g. orjson output), so
+    skipping the BufferedWriter layer avoids an extra copy per write.
+    
+    Args:
+        file_path: Destination file, created or truncated
+        payload: Bytes to write
+    """
+    fd = os.open(str(file_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def json_dump_options(pretty: bool) -> int:
+    """
+    Build the orjson option flags used for JSON exports.
+    
+    Compact output (pretty=False) is roughly half the size and faster to
+    write than indented output.
+    
+    Args:
+        pretty: Whether to indent the output by two spaces
+        
+    Returns:
+        Option flags to pass to orjson.dumps
+    """
+    options = orjson.OPT_NON_STR_KEYS
+    if pretty:
+        options |= orjson.OPT_INDENT_2
+    return options
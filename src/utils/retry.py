@@ -0,0 +1,67 @@
+import time
+import random
+import logging
+from typing import Callable, Optional, TypeVar
+
+from googleapiclient.errors import HttpError
+
+
+T = TypeVar('T')
+
+# Rate limiting and transient server errors worth retrying
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+logger = logging.getLogger(__name__)
+
+
+def call_with_retry(
+    func: Callable[[], T],
+    max_attempts: int = 6,
+    initial_delay: float = 1.0,
+    max_delay: float = 60.0
+) -> T:
+    """
+    Call a Google API operation, retrying rate-limit and server errors.
+    
+    Waits grow exponentially with full jitter. When the server sends a
+    Retry-After header, that delay is used instead.
+    
+    Args:
+        func: Zero-argument callable, e.g. request.execute or downloader.next_chunk
+        max_attempts: Maximum number of attempts including the first
+        initial_delay: Base delay in seconds for the first retry
+        max_delay: Upper bound for any single delay in seconds
+        
+    Returns:
+        The callable's return value
+        
+    Raises:
+        HttpError: If the error is not retryable or attempts are exhausted
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return func()
+        except HttpError as e:
+            status = e.resp.status if e.resp is not None else None
+            if status not in RETRYABLE_STATUS_CODES or attempt == max_attempts:
+                raise
+            
+            delay = _retry_after_seconds(e)
+            if delay is None:
+                delay = random.uniform(0, initial_delay * 2 ** (attempt - 1))
+            delay = min(delay, max_delay)
+            
+            logger.warning(f"HTTP {status} from Google API, retrying in {delay:.1f}s (attempt {attempt}/{max_attempts})")
+            time.sleep(delay)
+
+
+def _retry_after_seconds(error: HttpError) -> Optional[float]:
+    """Get the delay requested by a Retry-After header, if any."""
+    retry_after = error.resp.get('retry-after') if error.resp is not None else None
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        # HTTP-date form is rare for Google APIs; fall back to backoff
+        return None